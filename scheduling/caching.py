@@ -0,0 +1,73 @@
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from small_app.cache_versions import VersionBumper, bump_version, get_version
+from small_app.models import Assignment, Events, Persons, Roles, Rosters
+
+# CacheVersion row shared by every process; cached rosters and share payloads key on it.
+DATA_VERSION = "scheduling:data"
+HITS_KEY = "scheduling:roster-cache:hits"
+MISSES_KEY = "scheduling:roster-cache:misses"
+
+# Models whose rows feed roster generation. Any write to them changes the data version.
+TRACKED_MODELS = (Persons, Roles, Events, Rosters, Assignment)
+TRACKED_M2M = (Persons.roles.through, Events.roles.through)
+
+
+def get_data_version() -> int:
+    """Return the current data version, read from the shared CacheVersion row."""
+    return get_version(DATA_VERSION)
+
+
+def bump_data_version(**kwargs) -> None:
+    """Invalidate every cached roster by moving to a fresh data version.
+
+    Save/delete signals bump through ``_bump_on_write``; call this directly
+    after bulk writes (``update()``, ``bulk_create()``) that bypass signals.
+    """
+    bump_version(DATA_VERSION)
+
+
+def roster_cache_key(target_date, seed: int, engine: str) -> str:
+    return f"scheduling:roster:{get_data_version()}:{target_date}:{engine}:{seed}"
+
+
+def get_cached_roster(key: str) -> Optional[Dict]:
+    roster_data = cache.get(key)
+    _incr(HITS_KEY if roster_data is not None else MISSES_KEY)
+    return roster_data
+
+
+def set_cached_roster(key: str, roster_data: Dict) -> None:
+    cache.set(key, roster_data, timeout=settings.ROSTER_CACHE_TIMEOUT)
+
+
+def get_cache_stats() -> Dict:
+    return {
+        "hits": cache.get(HITS_KEY, 0),
+        "misses": cache.get(MISSES_KEY, 0),
+        "data_version": get_data_version(),
+    }
+
+
+def _incr(key: str) -> None:
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr(); start counting again.
+        cache.set(key, 1, timeout=None)
+
+
+_bump_on_write = VersionBumper(DATA_VERSION)
+
+
+def connect_signals() -> None:
+    for model in TRACKED_MODELS:
+        post_save.connect(_bump_on_write, sender=model, dispatch_uid=f"scheduling-save-{model.__name__}")
+        post_delete.connect(_bump_on_write, sender=model, dispatch_uid=f"scheduling-delete-{model.__name__}")
+    for through in TRACKED_M2M:
+        m2m_changed.connect(_bump_on_write, sender=through, dispatch_uid=f"scheduling-m2m-{through.__name__}")
@@ -0,0 +1,208 @@
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, Iterable, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from small_app.models import Assignment, AssignmentCount, Rosters
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def refresh_assignment_counts(dates: Iterable[date]) -> None:
+    """Recount the AssignmentCount buckets for every month touched by ``dates``.
+
+    Signals (see ``connect_signals``) schedule this through ``mark_dirty`` for
+    every Assignment and Rosters write; bulk writes that skip signals
+    (``bulk_create``, ``update()``) call ``mark_dirty`` themselves. Only the
+    affected months are rebuilt, so the cost is bounded by one month of rows.
+    """
+    for month in sorted({month_start(d) for d in dates if d}):
+        rows = (
+            Assignment.objects
+            .filter(roster__date__gte=month, roster__date__lt=next_month(month))
+            .values('person_id', 'role_id')
+            .annotate(count=Count('id'))
+        )
+        with transaction.atomic():
+            AssignmentCount.objects.filter(month=month).delete()
+            AssignmentCount.objects.bulk_create([
+                AssignmentCount(
+                    person_id=row['person_id'],
+                    role_id=row['role_id'],
+                    month=month,
+                    count=row['count'],
+                )
+                for row in rows
+            ])
+
+
+def assignment_counts_between(start_date: date, end_date: date) -> Dict[Tuple[int, int], int]:
+    """Return ``{(person_id, role_id): count}`` for rosters dated start_date..end_date.
+
+    Whole months are read from the AssignmentCount buckets; only the partial
+    months at either edge of the range are counted from raw Assignment rows.
+    """
+    counts: Counter = Counter()
+    if start_date > end_date:
+        return counts
+
+    first_full = start_date if start_date.day == 1 else next_month(start_date)
+    after_full = first_full
+    while next_month(after_full) <= end_date + timedelta(days=1):
+        after_full = next_month(after_full)
+
+    if after_full > first_full:
+        buckets = (
+            AssignmentCount.objects
+            .filter(month__gte=first_full, month__lt=after_full)
+            .values('person_id', 'role_id')
+            .annotate(total=Sum('count'))
+        )
+        for row in buckets:
+            counts[(row['person_id'], row['role_id'])] += row['total']
+        edges = (
+            Q(roster__date__gte=start_date, roster__date__lt=first_full)
+            | Q(roster__date__gte=after_full, roster__date__lte=end_date)
+        )
+    else:
+        edges = Q(roster__date__gte=start_date, roster__date__lte=end_date)
+
+    raw = (
+        Assignment.objects
+        .filter(edges)
+        .values('person_id', 'role_id')
+        .annotate(total=Count('id'))
+    )
+    for row in raw:
+        counts[(row['person_id'], row['role_id'])] += row['total']
+
+    return counts
+
+
+def rebuild_all_assignment_counts() -> int:
+    """Recount every AssignmentCount bucket from scratch. Returns the number of buckets."""
+    rows = (
+        Assignment.objects
+        .annotate(month=TruncMonth('roster__date'))
+        .values('person_id', 'role_id', 'month')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    with transaction.atomic():
+        AssignmentCount.objects.all().delete()
+        created = AssignmentCount.objects.bulk_create(
+            [AssignmentCount(**row) for row in rows], batch_size=500
+        )
+    return len(created)
+
+
+# ──────────────────────────────────────────
+# Signal maintenance
+# ──────────────────────────────────────────
+# Dates and roster ids marked on a connection but not yet recounted.
+_DIRTY_ATTR = '_assignment_counts_dirty'
+
+
+def _dirty(connection):
+    dirty = getattr(connection, _DIRTY_ATTR, None)
+    if dirty is None:
+        dirty = (set(), set())
+        setattr(connection, _DIRTY_ATTR, dirty)
+    return dirty
+
+
+def _flush_dirty(using):
+    """on_commit hook: recount everything marked on the connection, then clear it.
+
+    Every mark registers this hook; the first to run does the work and the
+    rest find nothing left. Marks from a rolled back transaction stay in the
+    set and are recounted with the next commit, which is harmless.
+    """
+    dates, roster_ids = _dirty(transaction.get_connection(using))
+    if not dates and not roster_ids:
+        return
+    pending_dates, pending_ids = set(dates), set(roster_ids)
+    dates.clear()
+    roster_ids.clear()
+    refresh_assignment_counts(_resolve(pending_dates, pending_ids))
+
+
+def _resolve(dates, roster_ids):
+    if roster_ids:
+        dates = set(dates) | set(Rosters.objects.filter(pk__in=roster_ids).values_list('date', flat=True))
+    return dates
+
+
+def mark_dirty(dates: Iterable[date] = (), roster_ids: Iterable[int] = (), using=None) -> None:
+    """Recount the months of ``dates`` and ``roster_ids`` once the current transaction commits.
+
+    Marks made in one transaction collect in one set on the connection, so a
+    cascade that deletes a roster with fifty assignments recounts its month
+    once and roster dates are looked up in one query. Outside a transaction
+    the recount runs immediately.
+    """
+    dates = {d for d in dates if d}
+    roster_ids = {pk for pk in roster_ids if pk is not None}
+    if not dates and not roster_ids:
+        return
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        refresh_assignment_counts(_resolve(dates, roster_ids))
+        return
+    pending_dates, pending_ids = _dirty(connection)
+    pending_dates.update(dates)
+    pending_ids.update(roster_ids)
+    transaction.on_commit(lambda: _flush_dirty(using), using=using)
+
+
+def _stash_previous_assignment_roster(sender, instance, **kwargs):
+    instance._previous_roster_id = (
+        Assignment.objects.filter(pk=instance.pk).values_list('roster_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+def _assignment_saved(sender, instance, **kwargs):
+    mark_dirty(roster_ids=[getattr(instance, '_previous_roster_id', None), instance.roster_id])
+
+
+def _assignment_deleted(sender, instance, **kwargs):
+    # During a roster cascade the roster row is gone by commit time; the
+    # roster's own post_delete marks its date.
+    mark_dirty(roster_ids=[instance.roster_id])
+
+
+def _stash_previous_roster_date(sender, instance, **kwargs):
+    instance._previous_date = (
+        Rosters.objects.filter(pk=instance.pk).values_list('date', flat=True).first()
+        if instance.pk else None
+    )
+
+
+def _roster_saved(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_date', None)
+    if not created and previous != instance.date:
+        mark_dirty(dates=[previous, instance.date])
+
+
+def _roster_deleted(sender, instance, **kwargs):
+    mark_dirty(dates=[instance.date])
+
+
+def connect_signals() -> None:
+    pre_save.connect(_stash_previous_assignment_roster, sender=Assignment, dispatch_uid="counters-pre-save-assignment")
+    post_save.connect(_assignment_saved, sender=Assignment, dispatch_uid="counters-save-assignment")
+    post_delete.connect(_assignment_deleted, sender=Assignment, dispatch_uid="counters-delete-assignment")
+    pre_save.connect(_stash_previous_roster_date, sender=Rosters, dispatch_uid="counters-pre-save-roster")
+    post_save.connect(_roster_saved, sender=Rosters, dispatch_uid="counters-save-roster")
+    post_delete.connect(_roster_deleted, sender=Rosters, dispatch_uid="counters-delete-roster")
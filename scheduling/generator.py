@@ -2,12 +2,15 @@ import logging
 import random
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Prefetch
 
 from small_app.models import Assignment, Events, Persons, Roles, Rosters
+from .caching import bump_data_version
+from .counters import mark_dirty
+from .matching import min_cost_assignment
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,16 @@ class RosterGenerator:
 
     COOLDOWN_GENERATIONS = 3  # Generations a person must sit out before repeating a role
 
-    def __init__(self):
+    # "greedy" fills roles one at a time; "matching" solves every slot at once.
+    ENGINES = ("greedy", "matching")
+
+    def __init__(self, engine: str = "greedy", seed: Optional[int] = None):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Choose one of: {', '.join(self.ENGINES)}.")
+        self.engine = engine
+        # Private RNG: the same seed over the same data reproduces the same roster.
+        self.seed = seed
+        self._random = random.Random(seed)
         self.global_assigned: Set[int] = set()
         self.assignment_history: Dict[int, Dict[str, int]] = {}
         self.role_assignment_counts: Dict[str, Dict[int, int]] = {}
@@ -34,47 +46,99 @@ class RosterGenerator:
         # guarantee no back-to-back repeats even when the full cooldown pool is exhausted.
         self.previous_roster_holders: Dict[str, Set[int]] = {}
         self._assistant_producer_id: Optional[int] = None
+        # Role → eligible-person index, rebuilt once per generate() call from the
+        # Persons–Roles through table so candidate lookups are set operations.
+        self.people_by_id: Dict[int, Persons] = {}
+        self.role_members: Dict[int, Set[int]] = {}
+        # Flat (person_id, role name, roster date) history rows and the roster dates
+        # that count as generations. Kept so multi-date runs can chain in memory.
+        self._history_rows: List[Tuple[int, str, date]] = []
+        self._generation_dates: Set[date] = set()
+        self.events: List[Events] = []
+        self.roles: List[Roles] = []
+        self.available_people: List[Persons] = []
 
     # ------------------------------------------------------------------
     # History & cooldown helpers
     # ------------------------------------------------------------------
 
-    def _load_assignment_history(self, target_date: date, lookback_days: int = 90) -> None:
-        """Load assignment history from the last N days to inform rotation decisions."""
-        start_date = target_date - timedelta(days=lookback_days)
+    LOOKBACK_DAYS = 90
 
-        recent_assignments = Assignment.objects.filter(
-            roster__date__gte=start_date,
-            roster__date__lt=target_date
-        ).select_related('person', 'role', 'roster__event')
+    def _load_assignment_history(self, target_date: date) -> None:
+        """Load rotation history and generation cooldowns in a single pass.
 
-        self.assignment_history.clear()
-        self.role_assignment_counts.clear()
+        One flat (person_id, role name, roster date) query covers both the
+        lookback window and the last COOLDOWN_GENERATIONS roster dates, which
+        may reach further back than the window when rosters are sparse.
+        """
+        start_date = target_date - timedelta(days=self.LOOKBACK_DAYS)
 
-        for assignment in recent_assignments:
-            person_id = assignment.person.pk
-            role_name = assignment.role.name.lower()
+        recent_dates = self._recent_generation_dates(target_date)
+        window_start = min([start_date, *recent_dates])
 
-            if person_id not in self.assignment_history:
-                self.assignment_history[person_id] = {}
-            if role_name not in self.assignment_history[person_id]:
-                self.assignment_history[person_id][role_name] = 0
-            self.assignment_history[person_id][role_name] += 1
+        rows = Assignment.objects.filter(
+            roster__date__gte=window_start,
+            roster__date__lt=target_date,
+        ).values_list('person_id', 'role__name', 'roster__date')
 
-            if role_name not in self.role_assignment_counts:
-                self.role_assignment_counts[role_name] = {}
-            if person_id not in self.role_assignment_counts[role_name]:
-                self.role_assignment_counts[role_name][person_id] = 0
-            self.role_assignment_counts[role_name][person_id] += 1
+        self._history_rows = [
+            (person_id, role_name.lower(), roster_date)
+            for person_id, role_name, roster_date in rows
+        ]
+        self._generation_dates = set(recent_dates)
+        self._apply_history(target_date)
 
-        self._load_generation_cooldowns(target_date)
+    def _apply_history(self, target_date: date) -> None:
+        """Rebuild the rotation counters and cooldown maps as seen from target_date."""
+        start_date = target_date - timedelta(days=self.LOOKBACK_DAYS)
 
-    def _load_generation_cooldowns(self, target_date: date) -> None:
-        """Build a hard cooldown map from the last COOLDOWN_GENERATIONS roster dates."""
+        self.assignment_history.clear()
+        self.role_assignment_counts.clear()
         self.generation_cooldown.clear()
         self.previous_roster_holders.clear()
 
-        recent_dates = list(
+        recent_dates = sorted(
+            (d for d in self._generation_dates if d < target_date), reverse=True
+        )[:self.COOLDOWN_GENERATIONS]
+        most_recent_date = recent_dates[0] if recent_dates else None
+        cooldown_dates = set(recent_dates)
+
+        for person_id, role_name, roster_date in self._history_rows:
+            if roster_date >= target_date:
+                continue
+
+            if roster_date >= start_date:
+                person_counts = self.assignment_history.setdefault(person_id, {})
+                person_counts[role_name] = person_counts.get(role_name, 0) + 1
+                role_counts = self.role_assignment_counts.setdefault(role_name, {})
+                role_counts[person_id] = role_counts.get(person_id, 0) + 1
+
+            if roster_date in cooldown_dates:
+                self.generation_cooldown.setdefault(person_id, set()).add(role_name)
+                if roster_date == most_recent_date:
+                    self.previous_roster_holders.setdefault(role_name, set()).add(person_id)
+
+    def _record_generated_roster(self, roster_data: Dict, target_date: date) -> None:
+        """Feed a generated (unsaved) roster back into the history for later dates."""
+        rows = [
+            (a['person_id'], a['role'].lower(), target_date)
+            for event_data in roster_data['events']
+            for a in event_data['assignments']
+            if a['person_id'] is not None
+        ]
+        rows.append((roster_data['producer']['id'], "producer", target_date))
+        rows.append((roster_data['assistant_producer']['id'], "assistant producer", target_date))
+        rows.extend(
+            (p['person_id'], role_name, target_date)
+            for role_name, people in roster_data['special_roles'].items()
+            for p in people
+        )
+        self._history_rows.extend(rows)
+        self._generation_dates.add(target_date)
+
+    def _recent_generation_dates(self, target_date: date) -> List[date]:
+        """Return the last COOLDOWN_GENERATIONS roster dates before target_date, newest first."""
+        return list(
             Rosters.objects
             .filter(date__lt=target_date)
             .values_list('date', flat=True)
@@ -82,22 +146,6 @@ class RosterGenerator:
             .order_by('-date')[:self.COOLDOWN_GENERATIONS]
         )
 
-        if not recent_dates:
-            return
-
-        most_recent_date = recent_dates[0]
-
-        cooldown_assignments = Assignment.objects.filter(
-            roster__date__in=recent_dates
-        ).select_related('person', 'role', 'roster')
-
-        for assignment in cooldown_assignments:
-            person_id = assignment.person.pk
-            role_name = assignment.role.name.lower()
-            self.generation_cooldown.setdefault(person_id, set()).add(role_name)
-            if assignment.roster.date == most_recent_date:
-                self.previous_roster_holders.setdefault(role_name, set()).add(person_id)
-
     def _is_on_cooldown(self, person_id: int, role_name: str) -> bool:
         return role_name.lower() in self.generation_cooldown.get(person_id, set())
 
@@ -120,6 +168,26 @@ class RosterGenerator:
             return no_back_to_back
         return people
 
+    # ------------------------------------------------------------------
+    # Candidate index
+    # ------------------------------------------------------------------
+
+    def _build_role_index(self, people: List[Persons]) -> None:
+        """Index the available people by role id using flat id pairs."""
+        self.people_by_id = {p.pk: p for p in people}
+        self.role_members = {}
+
+        memberships = Persons.roles.through.objects.filter(
+            persons_id__in=self.people_by_id.keys()
+        ).values_list('roles_id', 'persons_id')
+
+        for role_id, person_id in memberships:
+            self.role_members.setdefault(role_id, set()).add(person_id)
+
+    def _people_from_ids(self, person_ids: Set[int]) -> List[Persons]:
+        # Sorted so candidate order does not depend on set iteration order.
+        return [self.people_by_id[pid] for pid in sorted(person_ids)]
+
     # ------------------------------------------------------------------
     # Scoring & selection helpers
     # ------------------------------------------------------------------
@@ -136,7 +204,7 @@ class RosterGenerator:
         total_recent_assignments = sum(self.assignment_history.get(person_id, {}).values())
         score += total_recent_assignments * 2
 
-        score += random.random() * 0.5
+        score += self._random.random() * 0.5
         return score
 
     # Candidates within this many score points of the minimum are treated as tied
@@ -152,46 +220,46 @@ class RosterGenerator:
         ]
         min_score = min(score for score, _ in scored_people)
         tied = [person for score, person in scored_people if score <= min_score + self.SCORE_TIE_WINDOW]
-        return random.choice(tied)
+        return self._random.choice(tied)
 
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
 
-    def _validate_initial_data(self, events: QuerySet, roles: List[Roles], available_people: QuerySet) -> None:
-        if not events.filter(is_active=True).exists():
+    def _validate_initial_data(self, events: List[Events], roles: List[Roles], available_people: List[Persons]) -> None:
+        if not events:
             raise ValueError("No events defined.")
         if not roles:
             raise ValueError("No roles defined.")
-        if not available_people.filter(is_active=True, is_present=True).exists():
+        if not available_people:
             raise ValueError("No people marked as present for the selected date.")
 
     # ------------------------------------------------------------------
     # Leadership selection
     # ------------------------------------------------------------------
 
-    def _select_producer(self, available_people: QuerySet) -> Persons:
-        producer_pool = list(available_people.filter(is_producer=True, is_active=True, is_present=True))
+    def _select_producer(self, available_people: List[Persons]) -> Persons:
+        producer_pool = [p for p in available_people if p.is_producer]
         if not producer_pool:
             raise ValueError("No producer available.")
         candidates = self._filter_cooldown(producer_pool, "producer")
         producer = self._select_best_person_for_role(candidates, "producer")
         if not producer:
-            producer = random.choice(candidates)
+            producer = self._random.choice(candidates)
         self.global_assigned.add(producer.pk)
         return producer
 
-    def _select_assistant_producer(self, available_people: QuerySet) -> Persons:
-        assistant_pool = list(
-            available_people.filter(is_assistant_producer=True, is_active=True, is_present=True)
-            .exclude(pk__in=self.global_assigned)
-        )
+    def _select_assistant_producer(self, available_people: List[Persons]) -> Persons:
+        assistant_pool = [
+            p for p in available_people
+            if p.is_assistant_producer and p.pk not in self.global_assigned
+        ]
         if not assistant_pool:
             raise ValueError("No assistant producer available.")
         candidates = self._filter_cooldown(assistant_pool, "assistant producer")
         assistant = self._select_best_person_for_role(candidates, "assistant producer")
         if not assistant:
-            assistant = random.choice(candidates)
+            assistant = self._random.choice(candidates)
         # NOTE: Assistant producer is intentionally NOT added to global_assigned
         # so they remain eligible for one additional event/special role.
         self._assistant_producer_id = assistant.pk
@@ -201,7 +269,7 @@ class RosterGenerator:
     # Dynamic role assignment
     # ------------------------------------------------------------------
 
-    def _assign_event_roles(self, event: Events, available_people: QuerySet, roles: List[Roles]) -> List[RoleAssignment]:
+    def _assign_event_roles(self, event: Events, roles: List[Roles]) -> List[RoleAssignment]:
         """Assign the non-special roles bound to a single event.
 
         ``roles`` is the event's own role list, so an event with no bound roles
@@ -214,22 +282,19 @@ class RosterGenerator:
             role_name = role.name
 
             # People who are configured for this role
-            capable = [
-                p for p in available_people if p.is_active and p.is_present and role in p.roles.all()
-                if role in p.roles.all()
-            ]
+            capable = self.role_members.get(role.pk)
             if not capable:
                 # Nobody is configured for this role — skip silently
                 # (avoids noise for auto-created leadership roles like "Producer")
                 continue
 
-            not_yet_assigned = [p for p in capable if p.pk not in self.global_assigned]
+            not_yet_assigned = self._people_from_ids(capable - self.global_assigned)
             eligible = self._filter_cooldown(not_yet_assigned, role_name)
 
             if eligible:
                 chosen = self._select_best_person_for_role(eligible, role_name)
                 if not chosen:
-                    chosen = random.choice(eligible)
+                    chosen = self._random.choice(eligible)
                 event_assignments.append(RoleAssignment(
                     role=role_name,
                     name=f"{chosen.first_name} {chosen.last_name}",
@@ -251,7 +316,7 @@ class RosterGenerator:
 
         return event_assignments
 
-    def _assign_special_roles(self, available_people: QuerySet, roles: List[Roles]) -> Dict[str, List[Dict]]:
+    def _assign_special_roles(self, roles: List[Roles]) -> Dict[str, List[Dict]]:
         """Assign every special role dynamically from the database."""
         result: Dict[str, List[Dict]] = {}
         special_roles = [r for r in roles if r.is_special_role]
@@ -260,14 +325,11 @@ class RosterGenerator:
             role_name = role.name
             max_count = role.max_assignments
 
-            capable = [
-                p for p in available_people
-                if p.is_active and p.is_present and role in p.roles.all()
-            ]
+            capable = self.role_members.get(role.pk)
             if not capable:
                 continue
 
-            not_yet_assigned = [p for p in capable if p.pk not in self.global_assigned]
+            not_yet_assigned = self._people_from_ids(capable - self.global_assigned)
             candidates = self._filter_cooldown(not_yet_assigned, role_name)
 
             if not candidates:
@@ -284,7 +346,7 @@ class RosterGenerator:
                     remaining.remove(best)
 
             if not selected and candidates:
-                selected = random.sample(candidates, min(max_count, len(candidates)))
+                selected = self._random.sample(candidates, min(max_count, len(candidates)))
 
             result[role_name.lower()] = [
                 {"person_id": p.pk, "name": f"{p.first_name} {p.last_name}"}
@@ -294,58 +356,154 @@ class RosterGenerator:
 
         return result
 
+    # ------------------------------------------------------------------
+    # Matching engine
+    # ------------------------------------------------------------------
+
+    def _slot_costs(self, role: Roles) -> Dict[int, float]:
+        """Priority-score costs for everyone eligible to fill one slot of ``role``."""
+        not_yet_assigned = self._people_from_ids(self.role_members[role.pk] - self.global_assigned)
+        eligible = self._filter_cooldown(not_yet_assigned, role.name)
+        return {p.pk: self._calculate_person_priority_score(p, role.name) for p in eligible}
+
+    def _assign_roles_by_matching(self, event_roles: List[Tuple[Events, List[Roles]]],
+                                  special_roles: List[Roles]) -> Tuple[Dict[int, List[RoleAssignment]], Dict[str, List[Dict]]]:
+        """Fill every event and special role slot in one min-cost matching.
+
+        Unlike the greedy pass, an early role cannot take a person a later role
+        needed, so every slot that can be filled alongside the others is.
+        """
+        slots: List[Tuple[Optional[Events], Roles]] = []
+        for event, roles in event_roles:
+            slots.extend(
+                (event, role) for role in roles
+                if not role.is_special_role and self.role_members.get(role.pk)
+            )
+        for role in special_roles:
+            if self.role_members.get(role.pk):
+                slots.extend((None, role) for _ in range(role.max_assignments))
+
+        chosen_ids = min_cost_assignment([self._slot_costs(role) for _, role in slots])
+        self.global_assigned.update(pid for pid in chosen_ids if pid is not None)
+
+        event_assignments: Dict[int, List[RoleAssignment]] = {event.pk: [] for event, _ in event_roles}
+        special_result: Dict[str, List[Dict]] = {
+            role.name.lower(): [] for role in special_roles if self.role_members.get(role.pk)
+        }
+        for (event, role), person_id in zip(slots, chosen_ids):
+            person = self.people_by_id.get(person_id)
+            if event is None:
+                if person:
+                    special_result[role.name.lower()].append(
+                        {"person_id": person.pk, "name": f"{person.first_name} {person.last_name}"}
+                    )
+                continue
+            if not person:
+                logger.info(
+                    "No fresh person for role '%s' in event '%s' — leaving slot empty",
+                    role.name, event.name
+                )
+            event_assignments[event.pk].append(RoleAssignment(
+                role=role.name,
+                name=f"{person.first_name} {person.last_name}" if person else "",
+                person_id=person.pk if person else None,
+            ))
+
+        return event_assignments, special_result
+
     # ------------------------------------------------------------------
     # Main generation
     # ------------------------------------------------------------------
 
+    def _load_reference_data(self) -> None:
+        """Load the events, roles and people every generated date draws from."""
+        self.events = list(
+            Events.objects.filter(is_active=True).order_by('id')
+            .prefetch_related(Prefetch('roles', queryset=Roles.objects.order_by('id')))
+        )
+        self.roles = list(Roles.objects.order_by('id'))
+        self.available_people = list(
+            Persons.objects.filter(is_present=True, is_active=True).order_by('id')
+        )
+
+        self._validate_initial_data(self.events, self.roles, self.available_people)
+        self._build_role_index(self.available_people)
+
     def generate(self, target_date: date) -> Dict:
         """Generate a roster for the given date — fully driven by database roles."""
         logger.info("Starting roster generation for date: %s", target_date)
 
-        self.global_assigned.clear()
         self._load_assignment_history(target_date)
+        self._load_reference_data()
+        return self._generate_for_date(target_date)
 
-        events = Events.objects.filter(is_active=True).order_by('id').prefetch_related('roles')
-        roles = list(Roles.objects.all())
-        available_people = Persons.objects.filter(
-            is_present=True, is_active=True
-        ).prefetch_related('roles')
+    def generate_range(self, dates: Iterable[date],
+                       progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+        """Generate rosters for several dates from a single load of reference data.
 
-        self._validate_initial_data(events, roles, available_people)
+        History is loaded once as of the earliest date; each generated roster is
+        then chained into the in-memory rotation state for the dates after it.
+        """
+        dates = sorted(set(dates))
+        if not dates:
+            return []
+        logger.info("Starting roster generation for %d dates: %s to %s", len(dates), dates[0], dates[-1])
+
+        self._load_assignment_history(dates[0])
+        self._load_reference_data()
+
+        rosters = []
+        for target_date in dates:
+            self._apply_history(target_date)
+            roster_data = self._generate_for_date(target_date)
+            self._record_generated_roster(roster_data, target_date)
+            rosters.append(roster_data)
+            if progress:
+                progress(len(rosters), len(dates))
+        return rosters
+
+    def _generate_for_date(self, target_date: date) -> Dict:
+        self.global_assigned.clear()
+        events = self.events
+        available_people = self.available_people
 
         # Leadership
         producer = self._select_producer(available_people)
         assistant_producer = self._select_assistant_producer(available_people)
 
         # Event roles — each event only fills the roles bound to it.
-        event_list = []
-        special_role_pool: Dict[int, Roles] = {}
-        for event in events:
-            event_roles = list(event.roles.all())
-            # Collect special roles bound to any event for the union pass below.
-            for r in event_roles:
-                if r.is_special_role:
-                    special_role_pool[r.pk] = r
-
-            assignments = self._assign_event_roles(event, available_people, event_roles)
-            event_list.append({
+        event_roles = [(event, list(event.roles.all())) for event in events]
+        # Special roles — only those bound to at least one active event.
+        special_role_pool: Dict[int, Roles] = {
+            r.pk: r for _, roles in event_roles for r in roles if r.is_special_role
+        }
+
+        if self.engine == "matching":
+            assignments_by_event, special_roles = self._assign_roles_by_matching(
+                event_roles, list(special_role_pool.values())
+            )
+        else:
+            assignments_by_event = {
+                event.pk: self._assign_event_roles(event, roles) for event, roles in event_roles
+            }
+            special_roles = self._assign_special_roles(list(special_role_pool.values()))
+
+        event_list = [
+            {
                 "event_id": event.pk,
                 "event_name": event.name or event.description or "Unknown Event",
                 "assignments": [
                     {"role": a.role, "name": a.name, "person_id": a.person_id}
-                    for a in assignments
+                    for a in assignments_by_event[event.pk]
                 ],
-            })
-
-        # Special roles — only those bound to at least one active event.
-        special_roles = self._assign_special_roles(
-            available_people, list(special_role_pool.values())
-        )
+            }
+            for event, _ in event_roles
+        ]
 
         logger.info("Roster generated successfully. Total assigned: %d", len(self.global_assigned))
 
         # Summary
-        all_people = list(available_people)
+        all_people = available_people
         assigned_list = [
             {"person_id": p.pk, "name": f"{p.first_name} {p.last_name}"}
             for p in all_people if p.pk in self.global_assigned
@@ -355,13 +513,19 @@ class RosterGenerator:
             for p in all_people if p.pk not in self.global_assigned
         ]
 
+        metadata = {
+            "total_people_available": len(all_people),
+            "total_assignments": len(self.global_assigned),
+            "seed": self.seed,
+        }
+        # A seeded roster is a pure function of (date, seed, data) and may be
+        # served from cache, so it carries no wall-clock timestamp.
+        if self.seed is None:
+            metadata["generated_at"] = datetime.now().isoformat()
+
         return {
             "date": str(target_date),
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "total_people_available": len(all_people),
-                "total_assignments": len(self.global_assigned),
-            },
+            "metadata": metadata,
             "producer": {
                 "id": producer.pk,
                 "name": f"{producer.first_name} {producer.last_name}",
@@ -382,98 +546,134 @@ class RosterGenerator:
     # Database persistence
     # ------------------------------------------------------------------
 
+    # Leadership slots saved alongside the first roster entry: (data key, role name).
+    LEADERSHIP_ROLES = [
+        ("producer", "Producer"),
+        ("assistant_producer", "Assistant Producer"),
+    ]
+
     def save_roster_to_database(self, roster_data: Dict, target_date: date) -> None:
-        """Save the generated roster to the database for tracking assignment history."""
+        """Save the generated roster to the database for tracking assignment history.
+
+        People and roles are resolved with one query each and every assignment
+        is written with a single bulk_create, so the query count does not grow
+        with the size of the roster.
+        """
         try:
             with transaction.atomic():
-                events = Events.objects.filter(is_active=True)
-                first_roster_entry = None
+                events_data = {s['event_id']: s for s in roster_data.get('events', [])}
+                events = [
+                    e for e in Events.objects.filter(is_active=True).order_by('id')
+                    if e.pk in events_data
+                ]
+                if not events:
+                    logger.info("No active events in roster data for %s", target_date)
+                    return
+
+                roster_entries = self._get_or_create_roster_entries(events, target_date)
+                # Clear existing assignments for these roster entries
+                Assignment.objects.filter(roster__in=roster_entries.values()).delete()
+
+                roles_by_name = {r.name.lower(): r for r in Roles.objects.all()}
+                person_ids = set(
+                    Persons.objects.filter(pk__in=self._collect_person_ids(roster_data))
+                    .values_list('pk', flat=True)
+                )
 
+                rows = set()
                 for event in events:
-                    event_data = next(
-                        (s for s in roster_data.get('events', []) if s['event_id'] == event.pk),
-                        None,
-                    )
-                    if not event_data:
-                        continue
-
-                    roster_entry, _ = Rosters.objects.get_or_create(
-                        event=event,
-                        date=target_date,
-                    )
-
-                    if first_roster_entry is None:
-                        first_roster_entry = roster_entry
-
-                    # Clear existing assignments for this roster entry
-                    Assignment.objects.filter(roster=roster_entry).delete()
-
-                    for assignment_data in event_data.get('assignments', []):
-                        try:
-                            person = Persons.objects.get(id=assignment_data['person_id'])
-                            role = Roles.objects.filter(name__iexact=assignment_data['role']).first()
-                            if role:
-                                Assignment.objects.create(
-                                    roster=roster_entry,
-                                    role=role,
-                                    person=person,
-                                )
-                        except Persons.DoesNotExist as e:
-                            logger.warning("Could not create assignment: %s", e)
+                    roster_entry = roster_entries[event.pk]
+                    for assignment_data in events_data[event.pk].get('assignments', []):
+                        role = roles_by_name.get((assignment_data.get('role') or '').lower())
+                        person_id = assignment_data.get('person_id')
+                        if not role or person_id is None:
+                            continue
+                        if person_id not in person_ids:
+                            logger.warning("Could not create assignment: person %s not found", person_id)
+                            continue
+                        rows.add((roster_entry.pk, role.pk, person_id))
 
                 # Leadership + special roles saved to the first roster entry
-                if first_roster_entry:
-                    self._save_leadership_assignments(roster_data, first_roster_entry)
-                    self._save_special_role_assignments(roster_data, first_roster_entry)
-
+                first_roster_entry = roster_entries[events[0].pk]
+                rows.update(self._leadership_rows(roster_data, first_roster_entry, roles_by_name, person_ids))
+                rows.update(self._special_role_rows(roster_data, first_roster_entry, roles_by_name, person_ids))
+
+                Assignment.objects.bulk_create([
+                    Assignment(roster_id=roster_id, role_id=role_id, person_id=person_id)
+                    for roster_id, role_id, person_id in sorted(rows)
+                ])
+
+                # bulk_create skips signals; join the recount the clear-out delete scheduled.
+                mark_dirty(dates=[target_date])
+                bump_data_version()
                 logger.info("Roster saved to database for %s", target_date)
 
         except Exception as e:
             logger.exception("Error saving roster to database: %s", e)
             raise
 
-    def _save_leadership_assignments(self, roster_data: Dict, roster_entry: Rosters) -> None:
-        """Save producer and assistant producer assignments."""
-        leadership = [
-            ("producer", "Producer"),
-            ("assistant_producer", "Assistant Producer"),
-        ]
-        for data_key, role_display_name in leadership:
+    def _get_or_create_roster_entries(self, events: List[Events], target_date: date) -> Dict[int, Rosters]:
+        """Return ``{event_id: Rosters}`` for the date, creating missing entries in bulk."""
+        existing = {
+            r.event_id: r
+            for r in Rosters.objects.filter(date=target_date, event__in=events)
+        }
+        missing = [Rosters(event=e, date=target_date) for e in events if e.pk not in existing]
+        if missing:
+            Rosters.objects.bulk_create(missing)
+            existing.update({r.event_id: r for r in missing})
+        return existing
+
+    def _collect_person_ids(self, roster_data: Dict) -> Set[int]:
+        person_ids = {
+            a['person_id']
+            for event_data in roster_data.get('events', [])
+            for a in event_data.get('assignments', [])
+            if a.get('person_id') is not None
+        }
+        for data_key, _ in self.LEADERSHIP_ROLES:
+            if (roster_data.get(data_key) or {}).get('id') is not None:
+                person_ids.add(roster_data[data_key]['id'])
+        for people in roster_data.get('special_roles', {}).values():
+            person_ids.update(p['person_id'] for p in people if p.get('person_id') is not None)
+        return person_ids
+
+    def _leadership_rows(self, roster_data: Dict, roster_entry: Rosters,
+                         roles_by_name: Dict[str, Roles], person_ids: Set[int]) -> Set[tuple]:
+        """Build producer and assistant producer assignment rows."""
+        rows = set()
+        for data_key, role_display_name in self.LEADERSHIP_ROLES:
             person_data = roster_data.get(data_key)
             if not person_data:
                 continue
-            try:
-                person = Persons.objects.get(id=person_data['id'])
-            except Persons.DoesNotExist:
+            if person_data.get('id') not in person_ids:
                 logger.warning("Person not found for %s assignment", role_display_name)
                 continue
-            role, _ = Roles.objects.get_or_create(
-                name=role_display_name,
-                defaults={"description": role_display_name, "is_special_role": False},
-            )
-            Assignment.objects.get_or_create(
-                roster=roster_entry,
-                role=role,
-                person=person,
-            )
-
-    def _save_special_role_assignments(self, roster_data: Dict, roster_entry: Rosters) -> None:
-        """Save special role assignments for cooldown tracking."""
+            role = roles_by_name.get(role_display_name.lower())
+            if role is None:
+                role, _ = Roles.objects.get_or_create(
+                    name=role_display_name,
+                    defaults={"description": role_display_name, "is_special_role": False},
+                )
+                roles_by_name[role_display_name.lower()] = role
+            rows.add((roster_entry.pk, role.pk, person_data['id']))
+        return rows
+
+    def _special_role_rows(self, roster_data: Dict, roster_entry: Rosters,
+                           roles_by_name: Dict[str, Roles], person_ids: Set[int]) -> Set[tuple]:
+        """Build special role assignment rows for cooldown tracking."""
+        rows = set()
         special_roles = roster_data.get('special_roles', {})
         for role_key, people in special_roles.items():
-            role = Roles.objects.filter(name__iexact=role_key).first()
+            role = roles_by_name.get(role_key.lower())
             if not role:
                 continue
             for person_data in people:
-                try:
-                    person = Persons.objects.get(id=person_data['person_id'])
-                    Assignment.objects.get_or_create(
-                        roster=roster_entry,
-                        role=role,
-                        person=person,
-                    )
-                except Persons.DoesNotExist:
+                if person_data.get('person_id') not in person_ids:
                     logger.warning(
                         "Person %s not found for role '%s'",
                         person_data.get('person_id'), role_key
                     )
+                    continue
+                rows.add((roster_entry.pk, role.pk, person_data['person_id']))
+        return rows
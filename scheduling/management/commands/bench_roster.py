@@ -0,0 +1,154 @@
+import json
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from small_app.models import Assignment, Events, Persons, Roles, Rosters
+from scheduling.generator import RosterGenerator
+
+# (persons, roles, events, years of history)
+SCENARIOS = {
+    "small": (50, 10, 3, 1),
+    "medium": (500, 100, 20, 1),
+    "large": (5000, 100, 20, 5),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark RosterGenerator.generate and save_roster_to_database on synthetic "
+        "data in a throwaway SQLite database and print the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenario', action='append', choices=sorted(SCENARIOS),
+            help="Preset dataset size; repeat to run several (default: all).",
+        )
+        parser.add_argument('--persons', type=int, help="Custom dataset: number of persons.")
+        parser.add_argument('--roles', type=int, default=10, help="Custom dataset: number of roles.")
+        parser.add_argument('--events', type=int, default=3, help="Custom dataset: number of events.")
+        parser.add_argument('--years', type=int, default=1, help="Custom dataset: years of weekly history.")
+        parser.add_argument('--engine', choices=RosterGenerator.ENGINES, default="greedy")
+        parser.add_argument('--seed', type=int, default=0, help="Seed for data and generation.")
+        parser.add_argument('--output', help="Also write the JSON report to this file.")
+
+    def handle(self, *args, **options):
+        if options['persons']:
+            scenarios = {"custom": (options['persons'], options['roles'], options['events'], options['years'])}
+        else:
+            names = options['scenario'] or list(SCENARIOS)
+            scenarios = {name: SCENARIOS[name] for name in names}
+
+        if connection.vendor != 'sqlite':
+            raise CommandError(
+                "bench_roster only runs against SQLite. Unset DATABASE_URL or point it at a sqlite:/// URL."
+            )
+
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            results = [
+                self._run(name, *sizes, engine=options['engine'], seed=options['seed'])
+                for name, sizes in scenarios.items()
+            ]
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        report = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as fh:
+                fh.write(report + "\n")
+        self.stdout.write(report)
+
+    def _run(self, name, persons, roles, events, years, engine, seed):
+        target_date = date(2026, 1, 4)
+        with transaction.atomic():
+            build_started = time.perf_counter()
+            _build_dataset(random.Random(seed), persons, roles, events, years, target_date)
+            build_seconds = time.perf_counter() - build_started
+
+            generator = RosterGenerator(engine=engine, seed=seed)
+            generate_stats, roster_data = _measure(lambda: generator.generate(target_date))
+            save_stats, _ = _measure(lambda: generator.save_roster_to_database(roster_data, target_date))
+
+            transaction.set_rollback(True)
+
+        return {
+            "scenario": name,
+            "engine": engine,
+            "persons": persons,
+            "roles": roles,
+            "events": events,
+            "history_years": years,
+            "build_seconds": round(build_seconds, 3),
+            "generate": generate_stats,
+            "save": save_stats,
+        }
+
+
+def _measure(func):
+    """Time ``func`` and count its queries, then re-run it under tracemalloc.
+
+    Memory is traced on a second call so tracing overhead does not skew the
+    wall-clock numbers; both calls must therefore be safe to repeat.
+    """
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        result = func()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_ms": round(elapsed * 1000, 2),
+        "queries": len(queries),
+        "sql_ms": round(sum(float(q['time']) for q in queries.captured_queries) * 1000, 2),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }, result
+
+
+def _build_dataset(rng, persons, roles, events, years, target_date):
+    """Create synthetic roles, events, people and weekly assignment history."""
+    role_objs = Roles.objects.bulk_create([
+        Roles(name=f"Role {i}", is_special_role=(i % 10 == 9), max_assignments=2 if i % 10 == 9 else 1)
+        for i in range(roles)
+    ])
+    event_objs = Events.objects.bulk_create([Events(name=f"Event {i}") for i in range(events)])
+    for i, event in enumerate(event_objs):
+        event.roles.set([r for j, r in enumerate(role_objs) if j % events == i])
+
+    person_objs = Persons.objects.bulk_create([
+        Persons(
+            first_name=f"First{i}", last_name=f"Last{i}", email=f"bench{i}@example.com",
+            is_producer=(i % 20 == 0), is_assistant_producer=(i % 20 == 1),
+        )
+        for i in range(persons)
+    ])
+    Through = Persons.roles.through
+    Through.objects.bulk_create([
+        Through(persons_id=person.pk, roles_id=role.pk)
+        for person in person_objs
+        for role in rng.sample(role_objs, min(len(role_objs), rng.randint(1, 3)))
+    ], batch_size=2000)
+
+    roster_dates = [target_date - timedelta(weeks=w) for w in range(1, years * 52 + 1)]
+    roster_objs = Rosters.objects.bulk_create([
+        Rosters(event=event, date=d) for d in roster_dates for event in event_objs
+    ], batch_size=2000)
+
+    roles_by_event = {event.pk: list(event.roles.all()) for event in event_objs}
+    Assignment.objects.bulk_create([
+        Assignment(roster=roster, role=role, person=rng.choice(person_objs))
+        for roster in roster_objs
+        for role in roles_by_event[roster.event_id]
+    ], batch_size=2000, ignore_conflicts=True)
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from scheduling.counters import rebuild_all_assignment_counts
+
+
+class Command(BaseCommand):
+    help = "Recount every monthly AssignmentCount bucket from the Assignment table."
+
+    def handle(self, *args, **options):
+        buckets = rebuild_all_assignment_counts()
+        self.stdout.write(f"Rebuilt {buckets} assignment count buckets.")
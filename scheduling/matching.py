@@ -0,0 +1,88 @@
+import heapq
+from typing import Dict, List, Optional
+
+INF = float('inf')
+
+
+def min_cost_assignment(slot_costs: List[Dict[int, float]]) -> List[Optional[int]]:
+    """Fill as many slots as possible at minimum total cost, one slot per candidate.
+
+    ``slot_costs[i]`` maps each candidate eligible for slot ``i`` to its cost.
+    Returns the chosen candidate per slot, or ``None`` for slots that cannot be
+    filled without leaving a fuller assignment unfilled.
+
+    Solved with the Hungarian algorithm over slots × candidates. Every slot gets
+    a private "leave empty" column priced above any real assignment, so the
+    solver maximises the number of filled slots first and cost second.
+    """
+    n = len(slot_costs)
+    if n == 0:
+        return []
+
+    # A slot never needs more than its n cheapest candidates: at most n - 1 of
+    # them can be taken by other slots, so one is always free to swap in.
+    pruned = [
+        {c: costs[c] for c in heapq.nsmallest(n, costs, key=costs.get)}
+        for costs in slot_costs
+    ]
+    candidates = sorted({c for costs in pruned for c in costs})
+    column_of = {c: j for j, c in enumerate(candidates)}
+    m = len(candidates) + n
+
+    max_cost = max((cost for costs in pruned for cost in costs.values()), default=0.0)
+    empty_cost = (abs(max_cost) + 1.0) * (n + 1)
+
+    matrix = []
+    for i, costs in enumerate(pruned):
+        row = [INF] * m
+        for c, cost in costs.items():
+            row[column_of[c]] = cost
+        row[len(candidates) + i] = empty_cost
+        matrix.append(row)
+
+    # Hungarian algorithm with potentials; rows and columns are 1-indexed and
+    # column 0 is the virtual start of each augmenting path.
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        match[0] = i
+        j0 = 0
+        minv = [INF] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            row = matrix[match[j0] - 1]
+            ui = u[match[j0]]
+            delta = INF
+            j1 = 0
+            for j in range(1, m + 1):
+                if used[j]:
+                    continue
+                cur = row[j - 1] - ui - v[j]
+                if cur < minv[j]:
+                    minv[j] = cur
+                    way[j] = j0
+                if minv[j] < delta:
+                    delta = minv[j]
+                    j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    result: List[Optional[int]] = [None] * n
+    for j in range(1, len(candidates) + 1):
+        if match[j]:
+            result[match[j] - 1] = candidates[j - 1]
+    return result
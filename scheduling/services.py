@@ -1,13 +1,33 @@
 from datetime import date, timedelta
-from typing import Dict
-from small_app.models import Assignment
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.db import transaction
+
+from small_app.models import Persons, Roles
+from .caching import get_cached_roster, roster_cache_key, set_cached_roster
+from .counters import assignment_counts_between
 from .generator import RosterGenerator
 
 
-def generate_roster(target_date: date, save_to_db: bool = True) -> Dict:
-    """Generate roster with effective rotation and automatic saving."""
-    generator = RosterGenerator()
+def generate_roster(target_date: date, save_to_db: bool = True, engine: str = "greedy",
+                    seed: Optional[int] = None) -> Dict:
+    """Generate roster with effective rotation and automatic saving.
+
+    Passing ``seed`` makes the result reproducible for the same date and data,
+    so seeded results are served from the cache until the data changes.
+    Unseeded calls are random by design and always regenerate.
+    """
+    generator = RosterGenerator(engine=engine, seed=seed)
+
+    cache_key = roster_cache_key(target_date, seed, engine) if seed is not None else None
+    if cache_key:
+        cached = get_cached_roster(cache_key)
+        if cached is not None:
+            return cached
+
     roster_data = generator.generate(target_date)
+    if cache_key:
+        set_cached_roster(cache_key, roster_data)
 
     # if save_to_db:
     #     try:
@@ -19,40 +39,96 @@ def generate_roster(target_date: date, save_to_db: bool = True) -> Dict:
     return roster_data
 
 
+# Upper bound on the span of a single batch request (about a year of planning).
+MAX_RANGE_DAYS = 366
+
+
+def dates_in_range(start_date: date, end_date: date, weekdays: Optional[Iterable[int]] = None) -> List[date]:
+    """Return every date from start_date to end_date (inclusive) on the given weekdays.
+
+    ``weekdays`` uses Python's numbering (Monday=0 … Sunday=6). When omitted,
+    the weekday of ``start_date`` is used, i.e. one roster per week.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must be on or after start_date.")
+    if (end_date - start_date).days >= MAX_RANGE_DAYS:
+        raise ValueError(f"Date range cannot exceed {MAX_RANGE_DAYS} days.")
+
+    wanted = set(weekdays) if weekdays else {start_date.weekday()}
+    if not wanted <= set(range(7)):
+        raise ValueError("weekdays must be integers from 0 (Monday) to 6 (Sunday).")
+
+    return [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+        if (start_date + timedelta(days=offset)).weekday() in wanted
+    ]
+
+
+def generate_range(start_date: date, end_date: date, weekdays: Optional[Iterable[int]] = None,
+                   save_to_db: bool = True, engine: str = "greedy",
+                   seed: Optional[int] = None,
+                   progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+    """Generate rosters for every matching date in a range and save them together.
+
+    ``progress(done, total)`` is called after each date is generated.
+    """
+    target_dates = dates_in_range(start_date, end_date, weekdays)
+    if not target_dates:
+        return []
+
+    generator = RosterGenerator(engine=engine, seed=seed)
+    rosters = generator.generate_range(target_dates, progress=progress)
+
+    if save_to_db:
+        with transaction.atomic():
+            for target_date, roster_data in zip(target_dates, rosters):
+                generator.save_roster_to_database(roster_data, target_date)
+
+    return rosters
+
+
 def get_assignment_statistics(lookback_days: int = 90) -> Dict:
     """Get assignment statistics for the last N days."""
     end_date = date.today()
     start_date = end_date - timedelta(days=lookback_days)
 
-    assignments = Assignment.objects.filter(
-        roster__date__gte=start_date,
-        roster__date__lte=end_date
-    ).select_related('person', 'role')
+    counts = assignment_counts_between(start_date, end_date)
+
+    person_names = {
+        pk: f"{first_name} {last_name}"
+        for pk, first_name, last_name in Persons.objects.filter(
+            pk__in={person_id for person_id, _ in counts}
+        ).values_list('pk', 'first_name', 'last_name')
+    }
+    role_names = dict(
+        Roles.objects.filter(pk__in={role_id for _, role_id in counts}).values_list('pk', 'name')
+    )
 
     person_stats = {}
     role_stats = {}
 
-    for assignment in assignments:
-        person_name = f"{assignment.person.first_name} {assignment.person.last_name}"
-        role_name = assignment.role.name
+    for (person_id, role_id), count in counts.items():
+        person_name = person_names[person_id]
+        role_name = role_names[role_id]
 
         if person_name not in person_stats:
             person_stats[person_name] = {"total_assignments": 0, "roles": {}}
-        person_stats[person_name]["total_assignments"] += 1
+        person_stats[person_name]["total_assignments"] += count
         if role_name not in person_stats[person_name]["roles"]:
             person_stats[person_name]["roles"][role_name] = 0
-        person_stats[person_name]["roles"][role_name] += 1
+        person_stats[person_name]["roles"][role_name] += count
 
         if role_name not in role_stats:
             role_stats[role_name] = {"total_assignments": 0, "people": {}}
-        role_stats[role_name]["total_assignments"] += 1
+        role_stats[role_name]["total_assignments"] += count
         if person_name not in role_stats[role_name]["people"]:
             role_stats[role_name]["people"][person_name] = 0
-        role_stats[role_name]["people"][person_name] += 1
+        role_stats[role_name]["people"][person_name] += count
 
     return {
         "period": f"{start_date} to {end_date}",
         "person_statistics": person_stats,
         "role_statistics": role_stats,
-        "total_assignments": len(assignments),
+        "total_assignments": sum(counts.values()),
     }
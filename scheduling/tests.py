@@ -1,3 +1,305 @@
+from datetime import date
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from small_app.models import Assignment, AssignmentCount, BackgroundJob, Events, Persons, Roles, Rosters
+from .counters import assignment_counts_between, refresh_assignment_counts
+from .caching import get_cache_stats
+from .services import dates_in_range, generate_range, generate_roster, get_assignment_statistics
+from .generator import RosterGenerator
+from .matching import min_cost_assignment
+
+
+class RosterGeneratorTests(TestCase):
+    def setUp(self):
+        self.camera = Roles.objects.create(name="Camera")
+        self.sound = Roles.objects.create(name="Sound")
+        self.event = Events.objects.create(name="First Service")
+        self.event.roles.set([self.camera, self.sound])
+
+        self.producer = Persons.objects.create(
+            first_name="Pat", last_name="Producer", email="pat@example.com",
+            is_producer=True,
+        )
+        self.assistant = Persons.objects.create(
+            first_name="Alex", last_name="Assistant", email="alex@example.com",
+            is_assistant_producer=True,
+        )
+        self.members = []
+        for i in range(6):
+            person = Persons.objects.create(
+                first_name=f"Member{i}", last_name="Test", email=f"member{i}@example.com",
+            )
+            person.roles.set([self.camera] if i % 2 else [self.sound])
+            self.members.append(person)
+
+    def test_generate_fills_event_roles_from_role_members(self):
+        roster = RosterGenerator().generate(date(2026, 1, 4))
+
+        assignments = {a['role']: a['person_id'] for a in roster['events'][0]['assignments']}
+        camera_ids = {p.pk for p in self.members if self.camera in p.roles.all()}
+        sound_ids = {p.pk for p in self.members if self.sound in p.roles.all()}
+        self.assertIn(assignments['Camera'], camera_ids)
+        self.assertIn(assignments['Sound'], sound_ids)
+
+    def test_inactive_people_are_not_candidates(self):
+        Persons.objects.exclude(pk=self.members[1].pk).filter(roles=self.camera).update(is_active=False)
+
+        roster = RosterGenerator().generate(date(2026, 1, 4))
+
+        assignments = {a['role']: a['person_id'] for a in roster['events'][0]['assignments']}
+        self.assertEqual(assignments['Camera'], self.members[1].pk)
+
+    def test_history_loads_counts_and_cooldowns_in_one_pass(self):
+        roster = Rosters.objects.create(event=self.event, date=date(2025, 6, 1))
+        Assignment.objects.create(roster=roster, role=self.camera, person=self.members[1])
+
+        generator = RosterGenerator()
+        with self.assertNumQueries(2):
+            generator._load_assignment_history(date(2026, 1, 4))
+
+        # The only roster is outside the 90-day window but still a recent generation.
+        self.assertEqual(generator.assignment_history, {})
+        self.assertEqual(generator.generation_cooldown, {self.members[1].pk: {"camera"}})
+        self.assertEqual(generator.previous_roster_holders, {"camera": {self.members[1].pk}})
+
+    def test_save_roster_writes_every_assignment(self):
+        generator = RosterGenerator()
+        roster = generator.generate(date(2026, 1, 4))
+        generator.save_roster_to_database(roster, date(2026, 1, 4))
+
+        saved = set(Assignment.objects.values_list('role__name', 'person_id'))
+        expected = {(a['role'], a['person_id']) for a in roster['events'][0]['assignments']}
+        expected |= {
+            ("Producer", roster['producer']['id']),
+            ("Assistant Producer", roster['assistant_producer']['id']),
+        }
+        self.assertEqual(saved, expected)
+
+    # Includes the clear-out delete's and the final data-version bumps.
+    SAVE_QUERY_CEILING = 16
+
+    def test_save_roster_query_count_does_not_grow_with_roster(self):
+        for i in range(3):
+            event = Events.objects.create(name=f"Extra Service {i}")
+            event.roles.set([self.camera, self.sound])
+        for i in range(30):
+            person = Persons.objects.create(
+                first_name=f"Extra{i}", last_name="Test", email=f"extra{i}@example.com",
+            )
+            person.roles.set([self.camera, self.sound])
+        Roles.objects.create(name="Producer")
+        Roles.objects.create(name="Assistant Producer")
+
+        generator = RosterGenerator()
+        roster = generator.generate(date(2026, 1, 4))
+        with CaptureQueriesContext(connection) as first_save:
+            generator.save_roster_to_database(roster, date(2026, 1, 4))
+        with CaptureQueriesContext(connection) as resave:
+            generator.save_roster_to_database(roster, date(2026, 1, 4))
+
+        self.assertLessEqual(len(first_save), self.SAVE_QUERY_CEILING)
+        self.assertLessEqual(len(resave), self.SAVE_QUERY_CEILING)
+        self.assertEqual(Assignment.objects.count(), 4 * 2 + 2)
+
+    def test_resave_recounts_the_month_once_on_commit(self):
+        generator = RosterGenerator()
+        roster = generator.generate(date(2026, 1, 4))
+        generator.save_roster_to_database(roster, date(2026, 1, 4))
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                generator.save_roster_to_database(roster, date(2026, 1, 4))
+
+        recounts = [
+            q for q in queries.captured_queries if q['sql'].startswith('DELETE FROM "small_app_assignmentcount"')
+        ]
+        self.assertEqual(len(recounts), 1)
+        self.assertEqual(sum(AssignmentCount.objects.values_list('count', flat=True)), Assignment.objects.count())
+
+    def test_generate_range_chains_cooldowns_across_dates(self):
+        rosters = generate_range(date(2026, 1, 4), date(2026, 1, 18), [6])
+
+        self.assertEqual([r['date'] for r in rosters], ["2026-01-04", "2026-01-11", "2026-01-18"])
+        camera_holders = [
+            next(a['person_id'] for a in r['events'][0]['assignments'] if a['role'] == "Camera")
+            for r in rosters
+        ]
+        self.assertEqual(len(set(camera_holders)), 3)
+        self.assertEqual(
+            sorted(set(Rosters.objects.values_list('date', flat=True))),
+            [date(2026, 1, 4), date(2026, 1, 11), date(2026, 1, 18)],
+        )
+
+    def test_dates_in_range_defaults_to_start_weekday(self):
+        self.assertEqual(
+            dates_in_range(date(2026, 1, 4), date(2026, 1, 20)),
+            [date(2026, 1, 4), date(2026, 1, 11), date(2026, 1, 18)],
+        )
+        with self.assertRaises(ValueError):
+            dates_in_range(date(2026, 1, 4), date(2026, 1, 1))
+
+    def test_matching_engine_fills_slots_greedy_can_strand(self):
+        # Only members[0] can do Sound, but they can also do Camera.
+        for person in self.members:
+            person.roles.set([self.camera])
+        self.members[0].roles.add(self.sound)
+
+        for _ in range(5):
+            roster = RosterGenerator(engine="matching").generate(date(2026, 1, 4))
+            assignments = {a['role']: a['person_id'] for a in roster['events'][0]['assignments']}
+            self.assertEqual(assignments['Sound'], self.members[0].pk)
+            self.assertIsNotNone(assignments['Camera'])
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(ValueError):
+            RosterGenerator(engine="annealing")
+
+    def test_same_seed_reproduces_the_same_roster(self):
+        def generate(seed):
+            return RosterGenerator(seed=seed).generate(date(2026, 1, 4))
+
+        self.assertEqual(generate(7), generate(7))
+        self.assertEqual(generate(7)['metadata']['seed'], 7)
+        self.assertIn('generated_at', RosterGenerator().generate(date(2026, 1, 4))['metadata'])
+
+    def test_seeded_generation_is_served_from_cache_until_data_changes(self):
+        cache.clear()
+        first = generate_roster(date(2026, 1, 4), seed=3)
+        # Only the shared data-version lookup.
+        with self.assertNumQueries(1):
+            self.assertEqual(generate_roster(date(2026, 1, 4), seed=3), first)
+        self.assertEqual((get_cache_stats()['hits'], get_cache_stats()['misses']), (1, 1))
+
+        self.members[0].roles.add(self.camera)
+        with CaptureQueriesContext(connection) as regenerated:
+            generate_roster(date(2026, 1, 4), seed=3)
+        self.assertGreater(len(regenerated), 0)
+
+
+class AssignmentCountTests(TestCase):
+    def setUp(self):
+        self.role = Roles.objects.create(name="Camera")
+        self.event = Events.objects.create(name="First Service")
+        self.person = Persons.objects.create(
+            first_name="Sam", last_name="Member", email="sam@example.com",
+        )
+        self.dates = [date(2026, 1, 4), date(2026, 2, 1), date(2026, 2, 22), date(2026, 3, 15)]
+        with self.captureOnCommitCallbacks(execute=True):
+            for roster_date in self.dates:
+                roster = Rosters.objects.create(event=self.event, date=roster_date)
+                Assignment.objects.create(roster=roster, role=self.role, person=self.person)
+
+    def test_refresh_builds_monthly_buckets(self):
+        buckets = dict(AssignmentCount.objects.values_list('month', 'count'))
+        self.assertEqual(buckets, {
+            date(2026, 1, 1): 1,
+            date(2026, 2, 1): 2,
+            date(2026, 3, 1): 1,
+        })
+
+    def test_counts_between_combines_buckets_and_partial_months(self):
+        key = (self.person.pk, self.role.pk)
+        self.assertEqual(assignment_counts_between(date(2026, 1, 1), date(2026, 3, 31))[key], 4)
+        self.assertEqual(assignment_counts_between(date(2026, 1, 5), date(2026, 3, 14))[key], 2)
+        self.assertEqual(assignment_counts_between(date(2026, 2, 2), date(2026, 2, 28))[key], 1)
+
+    def test_statistics_aggregate_pairs_in_constant_queries(self):
+        other = Persons.objects.create(first_name="Kim", last_name="Member", email="kim@example.com")
+        roster = Rosters.objects.get(date=date(2026, 2, 22))
+        Assignment.objects.create(roster=roster, role=self.role, person=other)
+        refresh_assignment_counts([roster.date])
+
+        lookback = (date.today() - date(2026, 1, 1)).days
+        # Whole-month buckets, raw edge months, person names, role names.
+        with self.assertNumQueries(4):
+            stats = get_assignment_statistics(lookback_days=lookback)
+
+        self.assertEqual(stats["total_assignments"], 5)
+        self.assertEqual(stats["person_statistics"]["Sam Member"], {"total_assignments": 4, "roles": {"Camera": 4}})
+        self.assertEqual(stats["role_statistics"]["Camera"]["people"], {"Sam Member": 4, "Kim Member": 1})
+
+    def test_refresh_drops_counts_for_deleted_rosters(self):
+        Rosters.objects.filter(date=date(2026, 2, 1)).delete()
+        refresh_assignment_counts([date(2026, 2, 1)])
+        self.assertEqual(AssignmentCount.objects.get(month=date(2026, 2, 1)).count, 1)
+
+    def _buckets(self):
+        return dict(AssignmentCount.objects.values_list('month', 'count'))
+
+    def test_signals_keep_buckets_current_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            roster = Rosters.objects.create(event=self.event, date=date(2026, 3, 29))
+            assignment = Assignment.objects.create(roster=roster, role=self.role, person=self.person)
+        self.assertEqual(self._buckets()[date(2026, 3, 1)], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            roster.date = date(2026, 4, 5)
+            roster.save()
+        self.assertEqual(self._buckets()[date(2026, 3, 1)], 1)
+        self.assertEqual(self._buckets()[date(2026, 4, 1)], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assignment.delete()
+        self.assertNotIn(date(2026, 4, 1), self._buckets())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Rosters.objects.get(date=date(2026, 1, 4)).delete()
+        self.assertNotIn(date(2026, 1, 1), self._buckets())
+
+    def test_rebuild_command_restores_drifted_buckets(self):
+        AssignmentCount.objects.filter(month=date(2026, 2, 1)).update(count=9)
+        AssignmentCount.objects.filter(month=date(2026, 3, 1)).delete()
+        out = StringIO()
+        call_command("rebuild_assignment_counts", stdout=out)
+        self.assertEqual(self._buckets(), {
+            date(2026, 1, 1): 1,
+            date(2026, 2, 1): 2,
+            date(2026, 3, 1): 1,
+        })
+        self.assertIn("Rebuilt 3", out.getvalue())
+
+
+class GenerateRangeViewTests(APITestCase):
+    def test_rejects_malformed_weekdays(self):
+        response = self.client.post(reverse("scheduling_generate_range"), {
+            "start_date": "2026-01-04", "end_date": "2026-01-31", "weekdays": "sunday",
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_async_rejects_unknown_engine_without_queueing(self):
+        response = self.client.post(reverse("scheduling_generate_range"), {
+            "start_date": "2026-01-04", "end_date": "2026-01-31", "engine": "annealing", "async": True,
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("annealing", response.json()["error"])
+        self.assertFalse(BackgroundJob.objects.exists())
+
+    def test_async_rejects_out_of_range_input_without_queueing(self):
+        for body in (
+            {"start_date": "2026-01-04", "end_date": "2036-01-04"},
+            {"start_date": "2026-01-04", "end_date": "2026-01-31", "weekdays": [9]},
+            {"start_date": "2026-01-31", "end_date": "2026-01-04"},
+        ):
+            response = self.client.post(reverse("scheduling_generate_range"), {**body, "async": True}, format='json')
+            self.assertEqual(response.status_code, 400, body)
+        self.assertFalse(BackgroundJob.objects.exists())
+
+
+class MinCostAssignmentTests(TestCase):
+    def test_prefers_filling_every_slot_over_cheapest_pick(self):
+        # Candidate 1 is cheapest for slot 0 but is the only option for slot 1.
+        self.assertEqual(
+            min_cost_assignment([{1: 0.0, 2: 5.0}, {1: 9.0}]),
+            [2, 1],
+        )
 
-# Create your tests here.
+    def test_leaves_unfillable_slots_empty(self):
+        result = min_cost_assignment([{1: 1.0}, {1: 2.0}, {3: 0.0}])
+        self.assertEqual(result, [1, None, 3])
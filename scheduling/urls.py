@@ -5,6 +5,9 @@ urlpatterns = [
     # Generate a new roster for a date
     path('generate/', views.generate_roster_view, name='scheduling_generate'),
 
+    # Generate and save rosters for every matching date in a range
+    path('generate/range/', views.generate_range_view, name='scheduling_generate_range'),
+
     # Wipe and regenerate a roster for a specific date
     path('roster/<str:date_str>/regenerate/', views.regenerate_roster_view, name='scheduling_regenerate'),
 
@@ -15,6 +18,9 @@ urlpatterns = [
     # Assignment statistics
     path('statistics/', views.roster_statistics_view, name='scheduling_statistics'),
 
+    # Generated-roster cache counters
+    path('cache/', views.roster_cache_stats_view, name='scheduling_cache_stats'),
+
     # Export a roster as PDF
     path('export/pdf/', views.export_roster_pdf_view, name='scheduling_export_pdf'),
 ]
@@ -6,22 +6,36 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 
+from small_app.feedback_rollup import refresh_daily_feedback
+from small_app.jobs import enqueue, job_payload
 from small_app.models import Rosters
 from small_app.serializers import AssignmentSerializer
 from small_app.pdf import export_roster_pdf
-from .services import generate_roster, get_assignment_statistics
+from .caching import get_cache_stats
+from .generator import RosterGenerator
+from .services import dates_in_range, generate_range, generate_roster, get_assignment_statistics
 
 logger = logging.getLogger(__name__)
 
 
+def _is_valid_seed(seed) -> bool:
+    return seed is None or (isinstance(seed, int) and not isinstance(seed, bool))
+
+
 @api_view(['POST'])
 def generate_roster_view(request):
     """Generate (and optionally save) a roster for a given date.
 
-    Body: { "date": "YYYY-MM-DD", "save_to_db": true }
+    Body: { "date": "YYYY-MM-DD", "save_to_db": true, "engine": "greedy", "seed": 42 }
+
+    ``engine`` is "greedy" (default) or "matching", which solves all slots at
+    once and fills every slot that can be filled. ``seed`` (optional integer)
+    makes the roster reproducible for the same date and data.
     """
     date_str = request.data.get('date')
     save_to_db = request.data.get('save_to_db', True)
+    engine = request.data.get('engine', 'greedy')
+    seed = request.data.get('seed')
 
     if not date_str:
         return Response(
@@ -29,6 +43,9 @@ def generate_roster_view(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    if not _is_valid_seed(seed):
+        return Response({'error': 'seed must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
     try:
         target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
     except ValueError:
@@ -38,7 +55,9 @@ def generate_roster_view(request):
         )
 
     try:
-        roster_data = generate_roster(target_date, save_to_db=save_to_db)
+        roster_data = generate_roster(
+            target_date, save_to_db=save_to_db, engine=engine, seed=seed
+        )
         return Response(roster_data, status=status.HTTP_201_CREATED)
     except ValueError as e:
         return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -47,6 +66,80 @@ def generate_roster_view(request):
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['POST'])
+def generate_range_view(request):
+    """Generate rosters for every matching date in a range in one batch.
+
+    Body: { "start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD",
+            "weekdays": [6], "save_to_db": true, "engine": "greedy", "seed": 42 }
+
+    ``weekdays`` uses Monday=0 … Sunday=6 and defaults to the start date's weekday.
+    With ``"async": true`` the batch is queued as a background job (202).
+    """
+    start_str = request.data.get('start_date')
+    end_str = request.data.get('end_date')
+    weekdays = request.data.get('weekdays')
+    save_to_db = request.data.get('save_to_db', True)
+    engine = request.data.get('engine', 'greedy')
+    seed = request.data.get('seed')
+
+    if not start_str or not end_str:
+        return Response(
+            {'error': 'start_date and end_date are required (YYYY-MM-DD)'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        start_date = datetime.strptime(start_str, '%Y-%m-%d').date()
+        end_date = datetime.strptime(end_str, '%Y-%m-%d').date()
+    except ValueError:
+        return Response(
+            {'error': 'Invalid date format. Use YYYY-MM-DD.'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if not _is_valid_seed(seed):
+        return Response({'error': 'seed must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+    if weekdays is not None and (
+        not isinstance(weekdays, list) or not all(isinstance(d, int) for d in weekdays)
+    ):
+        return Response(
+            {'error': 'weekdays must be a list of integers (Monday=0 … Sunday=6).'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # Same checks the job would hit, so bad input is a 400 rather than a failed job.
+    try:
+        dates_in_range(start_date, end_date, weekdays)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    if engine not in RosterGenerator.ENGINES:
+        return Response(
+            {'error': f"Unknown engine '{engine}'. Choose one of: {', '.join(RosterGenerator.ENGINES)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    if request.data.get('async'):
+        job = enqueue('generate_range', {
+            'start_date': start_str, 'end_date': end_str, 'weekdays': weekdays,
+            'save_to_db': save_to_db, 'engine': engine, 'seed': seed,
+        }, idempotency_key=request.headers.get('Idempotency-Key'),
+            created_by=request.user if request.user.is_authenticated else None)
+        return Response(job_payload(job), status=status.HTTP_202_ACCEPTED)
+
+    try:
+        rosters = generate_range(
+            start_date, end_date, weekdays, save_to_db=save_to_db, engine=engine, seed=seed
+        )
+        return Response({'rosters': rosters}, status=status.HTTP_201_CREATED)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.exception("Error generating rosters for %s to %s", start_str, end_str)
+        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 @api_view(['POST'])
 def regenerate_roster_view(request, date_str):
     """Delete the existing roster for a date and regenerate it.
@@ -62,6 +155,7 @@ def regenerate_roster_view(request, date_str):
         )
 
     deleted_count, _ = Rosters.objects.filter(date=target_date).delete()
+    refresh_daily_feedback([target_date])
     if deleted_count:
         logger.info("Cleared %d existing roster(s) for %s before regenerating", deleted_count, date_str)
 
@@ -123,6 +217,7 @@ def delete_roster_for_date_view(request, date_str):
         )
 
     deleted_count, _ = Rosters.objects.filter(date=target_date).delete()
+    refresh_daily_feedback([target_date])
     return Response(
         {'message': f'Deleted {deleted_count} roster(s) for {date_str}'},
         status=status.HTTP_200_OK,
@@ -143,16 +238,30 @@ def roster_statistics_view(request):
             {'error': 'lookback_days must be an integer'},
             status=status.HTTP_400_BAD_REQUEST,
         )
+    if lookback_days < 0:
+        return Response(
+            {'error': 'lookback_days must not be negative'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
     stats = get_assignment_statistics(lookback_days=lookback_days)
     return Response(stats, status=status.HTTP_200_OK)
 
 
+@api_view(['GET'])
+def roster_cache_stats_view(request):
+    """Return hit/miss counters and the current data version of the roster cache."""
+    return Response(get_cache_stats(), status=status.HTTP_200_OK)
+
+
 @api_view(['POST'])
 def export_roster_pdf_view(request):
     """Generate and return a PDF for the supplied roster data.
 
-    Body: { "roster_data": { ...same shape as generate response... } }
+    Body: { "roster_data": { ...same shape as generate response... }, "async": false }
+
+    With ``"async": true`` the PDF is rendered by a background job (202); fetch
+    it from /api/jobs/<id>/output/ once the job has succeeded.
     """
     roster_data = request.data.get('roster_data')
     if not roster_data:
@@ -161,6 +270,14 @@ def export_roster_pdf_view(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    if request.data.get('async'):
+        job = enqueue(
+            'roster_pdf', {'roster_data': roster_data},
+            idempotency_key=request.headers.get('Idempotency-Key'),
+            created_by=request.user if request.user.is_authenticated else None,
+        )
+        return Response(job_payload(job), status=status.HTTP_202_ACCEPTED)
+
     try:
         pdf_bytes = export_roster_pdf(roster_data)
     except Exception as e:
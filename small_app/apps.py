@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SmallAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'small_app'
+
+    def ready(self):
+        from .award_stats import connect_signals
+        connect_signals()
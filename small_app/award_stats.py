@@ -0,0 +1,102 @@
+"""Cached aggregates for the awards dashboard.
+
+``award_stats`` is computed from one grouped query and cached until an Award,
+AwardType or Persons write invalidates it (see ``connect_signals``). The key
+includes the shared CacheVersion counter, so a write in any process retires
+it, and the current month, so ``this_month`` rolls over on its own.
+"""
+from collections import Counter
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import post_delete, post_save
+
+from .cache_versions import VersionBumper, bump_version, get_version
+from .models import Award, AwardType, Persons
+
+VERSION = "awards:stats"
+
+
+def _cache_key(month_start):
+    return f"awards:stats:{get_version(VERSION)}:{month_start}"
+
+
+def invalidate_award_stats(**kwargs):
+    """Drop the cached dashboard after a write that bypasses signals."""
+    bump_version(VERSION)
+
+
+def get_award_stats():
+    month_start = date.today().replace(day=1)
+    key = _cache_key(month_start)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_award_stats(month_start)
+        cache.set(key, stats, timeout=settings.AWARD_STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def compute_award_stats(month_start):
+    """Build every dashboard figure from one (type, person, month) GROUP BY query.
+
+    Rows scale with distinct (type, person, month) triples, not with awards.
+    """
+    rows = (
+        Award.objects
+        .annotate(month=TruncMonth('given_at'))
+        .values(
+            'award_type', 'award_type__name',
+            'person', 'person__first_name', 'person__last_name',
+            'month',
+        )
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+
+    by_type = Counter()
+    type_names = {}
+    by_person = Counter()
+    person_names = {}
+    by_month = Counter()
+    this_month = 0
+    for row in rows:
+        count = row['count']
+        by_type[row['award_type']] += count
+        type_names[row['award_type']] = row['award_type__name']
+        by_person[row['person']] += count
+        person_names[row['person']] = f"{row['person__first_name']} {row['person__last_name']}".strip()
+        if row['month']:
+            by_month[row['month']] += count
+            if row['month'] >= month_start:
+                this_month += count
+
+    return {
+        'total': sum(by_type.values()),
+        'this_month': this_month,
+        'unique_recipients': len(by_person),
+        'unique_types': len(by_type),
+        'by_type': [
+            {'award_type_id': type_id, 'name': type_names[type_id], 'count': count}
+            for type_id, count in by_type.most_common()
+        ],
+        'top_recipients': [
+            {'person_id': person_id, 'name': person_names[person_id], 'count': count}
+            for person_id, count in by_person.most_common(10)
+        ],
+        'by_month': [
+            {'month': month.strftime('%Y-%m'), 'count': by_month[month]}
+            for month in sorted(by_month)
+        ],
+    }
+
+
+_bump_on_write = VersionBumper(VERSION)
+
+
+def connect_signals():
+    for model in (Award, AwardType, Persons):
+        post_save.connect(_bump_on_write, sender=model, dispatch_uid=f"award-stats-save-{model.__name__}")
+        post_delete.connect(_bump_on_write, sender=model, dispatch_uid=f"award-stats-delete-{model.__name__}")
@@ -0,0 +1,275 @@
+import ast
+import csv
+import io
+import json
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from scheduling.caching import bump_data_version
+
+from .models import MembersBulkUpload, Persons, Roles
+
+BATCH_SIZE = 500
+# Row errors kept in a streamed import's report; the total is always counted.
+MAX_REPORTED_ERRORS = 1000
+
+
+def parse_roles(roles):
+
+    if not roles:
+        return []
+
+    try:
+        return ast.literal_eval(roles)
+    except (ValueError, SyntaxError):
+        pass
+
+    try:
+        return json.loads(roles)
+    except (ValueError, TypeError):
+        pass
+
+    if isinstance(roles, str):
+            return [branch.strip() for branch in roles.split(',') if branch.strip()]
+
+    return [roles]
+
+
+def _as_bool(value):
+    return value in serializers.BooleanField.TRUE_VALUES
+
+
+def _as_text(value):
+    return str(value) if value is not None else None
+
+
+def _normalise_record(record):
+    """Apply the upload defaults and split a spreadsheet row into person fields + role names."""
+    first_name = _as_text(record.get('first_name'))
+    last_name = _as_text(record.get('last_name'))
+    phone_number = record.get('contact')
+    roles = record.get('roles', [])
+    role_names = roles if isinstance(roles, list) else parse_roles(roles)
+    if not isinstance(role_names, (list, tuple)):
+        role_names = [role_names]
+
+    fields = {
+        'first_name': first_name,
+        'last_name': last_name,
+        'email': record.get('email') or (
+            f"{first_name.lower()}.{last_name.lower()}@gmail.com"
+            if first_name and last_name else None
+        ),
+        'phone_number': str(phone_number) if phone_number else "0700000000",
+        'area_of_residence': record.get('area_of_residence') or "",
+        'is_producer': _as_bool(record.get('is_producer', False)),
+        'is_assistant_producer': _as_bool(record.get('is_assistant_producer', False)),
+        'is_active': True,
+    }
+    return fields, [str(name).strip() for name in role_names if str(name).strip()]
+
+
+def import_persons(records, first_row=1):
+    """Validate and insert spreadsheet rows as Persons in a fixed number of queries.
+
+    Rows are validated in memory against the model's field rules; email
+    uniqueness is checked with one query for the whole batch. Role names are
+    resolved case-insensitively with one query and missing roles are created
+    with one ``bulk_create``. Persons and their role links are then inserted in
+    bulk. Returns ``(created_count, errors)`` where ``errors`` is a list of
+    ``{"row": <1-based index>, "errors": {field: [messages]}}``; ``first_row``
+    offsets those indices when ``records`` is one chunk of a larger file.
+    """
+    errors = []
+    valid = []
+    for index, record in enumerate(records, start=first_row):
+        if not isinstance(record, dict):
+            errors.append({'row': index, 'errors': {'non_field_errors': ['Row must be an object.']}})
+            continue
+        fields, role_names = _normalise_record(record)
+        person = Persons(**fields)
+        try:
+            person.full_clean(validate_unique=False, validate_constraints=False)
+        except ValidationError as e:
+            errors.append({'row': index, 'errors': e.message_dict})
+            continue
+        valid.append((index, person, role_names))
+
+    emails = {person.email.lower() for _, person, _ in valid}
+    taken = {
+        email.lower()
+        for email in Persons.objects.annotate(lower_email=Lower('email'))
+        .filter(lower_email__in=emails).values_list('email', flat=True)
+    }
+    to_create = []
+    for index, person, role_names in valid:
+        email = person.email.lower()
+        if email in taken:
+            errors.append({'row': index, 'errors': {'email': ['Persons with this email already exists.']}})
+            continue
+        taken.add(email)
+        to_create.append((person, role_names))
+
+    if not to_create:
+        return 0, sorted(errors, key=lambda e: e['row'])
+
+    with transaction.atomic():
+        roles_by_name = _resolve_roles([name for _, names in to_create for name in names])
+        Persons.objects.bulk_create([person for person, _ in to_create], batch_size=BATCH_SIZE)
+
+        Through = Persons.roles.through
+        Through.objects.bulk_create(
+            {
+                (person.pk, roles_by_name[name.lower()]): Through(
+                    persons_id=person.pk, roles_id=roles_by_name[name.lower()]
+                )
+                for person, role_names in to_create
+                for name in role_names
+            }.values(),
+            batch_size=BATCH_SIZE,
+        )
+        # bulk_create skips model signals, so refresh the roster cache explicitly.
+        bump_data_version()
+
+    return len(to_create), sorted(errors, key=lambda e: e['row'])
+
+
+def _resolve_roles(names):
+    """Return ``{lower name: role id}``, creating missing roles in one insert.
+
+    A new role takes the spelling of the first row that mentions it.
+    """
+    wanted = {}
+    for name in names:
+        wanted.setdefault(name.lower(), name)
+
+    existing = {
+        lower_name: pk
+        for pk, lower_name in Roles.objects.annotate(lower_name=Lower('name'))
+        .filter(lower_name__in=wanted).values_list('pk', 'lower_name')
+    }
+    missing = [Roles(name=name) for lower_name, name in wanted.items() if lower_name not in existing]
+    if missing:
+        Roles.objects.bulk_create(missing)
+        existing.update({role.name.lower(): role.pk for role in missing})
+    return existing
+
+
+def iter_csv_records(fileobj):
+    """Yield each row of a binary CSV file as a dict, one row at a time.
+
+    Headers are normalised to the upload's field names (``First Name`` →
+    ``first_name``). A UTF-8 byte-order mark from Excel exports is ignored.
+    """
+    text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if header is None:
+            return
+        keys = [h.strip().lower().replace(' ', '_') for h in header]
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            yield {key: (value.strip() or None) for key, value in zip(keys, row)}
+    finally:
+        # Leave the underlying file open for the caller.
+        text.detach()
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def import_persons_stream(records, chunk_size=BATCH_SIZE, progress=None, first_row=1, checkpoint=None):
+    """Import an iterable of records in ``chunk_size`` batches via ``import_persons``.
+
+    Only one chunk is held in memory at a time. Each chunk commits on its own,
+    so an email clash is detected against everything imported before it.
+    ``checkpoint(rows, created, errors)`` runs inside each chunk's transaction,
+    so whatever it records commits together with the chunk's rows.
+    Returns ``(total, created, error_count, errors)``; ``errors`` is capped at
+    ``MAX_REPORTED_ERRORS`` entries. ``progress(processed)`` is called after
+    each chunk.
+    """
+    total = created = error_count = 0
+    errors = []
+    for chunk in chunked(records, chunk_size):
+        with transaction.atomic():
+            chunk_created, chunk_errors = import_persons(chunk, first_row=first_row + total)
+            if checkpoint:
+                checkpoint(len(chunk), chunk_created, chunk_errors)
+        total += len(chunk)
+        created += chunk_created
+        error_count += len(chunk_errors)
+        errors.extend(chunk_errors[:MAX_REPORTED_ERRORS - len(errors)])
+        if progress:
+            progress(total)
+    return total, created, error_count, errors
+
+
+UPLOAD_COUNTER_FIELDS = [
+    'number_of_records', 'processed_records', 'success_products', 'failed_products',
+    'error_count', 'errors', 'status', 'updated_at',
+]
+
+
+def _record_rows(upload, rows, created, errors):
+    upload.processed_records += rows
+    upload.success_products += created
+    upload.failed_products = upload.processed_records - upload.success_products
+    upload.error_count += len(errors)
+    upload.errors = (upload.errors + errors)[:MAX_REPORTED_ERRORS]
+    upload.save(update_fields=UPLOAD_COUNTER_FIELDS)
+
+
+def upload_result(upload):
+    return {
+        'total_records': upload.number_of_records,
+        'successful_uploads': upload.success_products,
+        'failed_uploads': upload.failed_products,
+        'error_count': upload.error_count,
+        'errors': upload.errors,
+    }
+
+
+def import_json_upload(upload):
+    """Import a JSON ``MembersBulkUpload`` and record its counters in the same transaction.
+
+    An upload that is already complete returns its recorded result, so a
+    retried job reports the first run's counts instead of flagging its own
+    rows as duplicate emails.
+    """
+    if not upload.status:
+        with transaction.atomic():
+            created, errors = import_persons(upload.json_data)
+            upload.status = True
+            _record_rows(upload, upload.number_of_records, created, errors)
+    return upload_result(upload)
+
+
+def import_csv_upload(upload, progress=None):
+    """Stream a stored CSV ``MembersBulkUpload`` into Persons and record its counters.
+
+    The counters are checkpointed with every chunk, so a retry after a crash
+    skips the rows already committed and keeps counting from there.
+    """
+    if not upload.status:
+        done = upload.processed_records
+        with upload.source_file.open('rb') as fh:
+            import_persons_stream(
+                islice(iter_csv_records(fh), done, None),
+                progress=(lambda processed: progress(done + processed)) if progress else None,
+                first_row=done + 1,
+                checkpoint=lambda rows, created, errors: _record_rows(upload, rows, created, errors),
+            )
+        upload.number_of_records = upload.processed_records
+        upload.status = True
+        upload.save(update_fields=UPLOAD_COUNTER_FIELDS)
+    return upload_result(upload)
@@ -0,0 +1,47 @@
+"""Database-backed version counters for cache keys.
+
+Cached values themselves may live in a per-process cache; the version that
+names them is one ``CacheVersion`` row, so a write in any process (web worker
+or job worker) invalidates every process's entries at once.
+"""
+import threading
+import weakref
+
+from django.db.models import F
+
+from .models import CacheVersion
+
+
+def get_version(name: str) -> int:
+    """Return the current version of ``name`` (0 until it is first bumped)."""
+    return CacheVersion.objects.filter(name=name).values_list('version', flat=True).first() or 0
+
+
+def bump_version(name: str) -> None:
+    """Move ``name`` to a new version, retiring every key built from the old one.
+
+    The bump is part of the caller's transaction, so a rolled back write
+    leaves the version where it was.
+    """
+    if not CacheVersion.objects.filter(name=name).update(version=F('version') + 1):
+        CacheVersion.objects.bulk_create([CacheVersion(name=name, version=1)], ignore_conflicts=True)
+
+
+class VersionBumper:
+    """Signal receiver that bumps one version for every write it is connected to.
+
+    A delete sends ``post_delete`` once per row, all with the same ``origin``
+    (the queryset or instance being deleted), so a cascade or a queryset
+    delete bumps once rather than once per row.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._local = threading.local()
+
+    def __call__(self, origin=None, **kwargs):
+        last = getattr(self._local, 'origin', None)
+        if origin is not None and last is not None and last() is origin:
+            return
+        self._local.origin = weakref.ref(origin) if origin is not None else None
+        bump_version(self.name)
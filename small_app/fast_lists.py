@@ -0,0 +1,124 @@
+"""Read-only list rows built straight from ``.values()``.
+
+Large GET lists (active members, roles, events, rosters) skip ModelSerializer
+instantiation and build plain dicts with exactly the keys, order and value
+formatting of their serializers. Dates and times are formatted with the same
+DRF field classes the serializers use, so the rendered JSON is byte-for-byte
+identical. Any change to those serializers' fields must be mirrored here
+(``TestFastListRows`` compares the two).
+"""
+from collections import defaultdict
+
+from rest_framework import serializers
+
+from .models import Events, Persons, Roles
+
+_datetime = serializers.DateTimeField()
+_date = serializers.DateField()
+_time = serializers.TimeField()
+
+
+def _fmt(field, value):
+    return None if value is None else field.to_representation(value)
+
+
+def _role_links(model, ids):
+    """Return ``{owner id: ([role ids], [role names])}`` for a roles M2M, in prefetch order."""
+    links = defaultdict(lambda: ([], []))
+    owner = 'persons' if model is Persons else 'events'
+    for owner_id, role_id, role_name in Roles.objects.filter(**{f'{owner}__in': ids}).values_list(
+        owner, 'pk', 'name'
+    ):
+        role_ids, role_names = links[owner_id]
+        role_ids.append(role_id)
+        role_names.append(role_name)
+    return links
+
+
+def person_rows(queryset):
+    """Rows shaped like ``PersonsSerializer(queryset, many=True).data``."""
+    people = list(queryset.values(
+        'id', 'first_name', 'last_name', 'email', 'phone_number', 'area_of_residence',
+        'is_producer', 'is_assistant_producer', 'is_present', 'is_active',
+        'created_at', 'updated_at',
+    ))
+    links = _role_links(Persons, [p['id'] for p in people])
+    rows = []
+    for p in people:
+        role_ids, role_names = links.get(p['id'], ((), ()))
+        rows.append({
+            'id': p['id'],
+            'first_name': p['first_name'],
+            'last_name': p['last_name'],
+            'name': f"{p['first_name']} {p['last_name']}".strip(),
+            'email': p['email'],
+            'phone_number': p['phone_number'],
+            'area_of_residence': p['area_of_residence'],
+            'is_producer': p['is_producer'],
+            'is_assistant_producer': p['is_assistant_producer'],
+            'is_present': p['is_present'],
+            'is_active': p['is_active'],
+            'roles': list(role_ids),
+            'role_names': list(role_names),
+            'created_at': _fmt(_datetime, p['created_at']),
+            'updated_at': _fmt(_datetime, p['updated_at']),
+        })
+    return rows
+
+
+def role_rows(queryset):
+    """Rows shaped like ``RolesSerializer(queryset, many=True).data``."""
+    return [
+        {
+            'id': r['id'],
+            'name': r['name'],
+            'description': r['description'],
+            'is_special_role': r['is_special_role'],
+            'max_assignments': r['max_assignments'],
+            'created_at': _fmt(_datetime, r['created_at']),
+            'updated_at': _fmt(_datetime, r['updated_at']),
+        }
+        for r in queryset.values(
+            'id', 'name', 'description', 'is_special_role', 'max_assignments', 'created_at', 'updated_at',
+        )
+    ]
+
+
+def event_rows(queryset):
+    """Rows shaped like ``EventsSerializer(queryset, many=True).data``."""
+    events = list(queryset.values(
+        'id', 'name', 'start_time', 'end_time', 'description', 'is_active', 'created_at', 'updated_at',
+    ))
+    links = _role_links(Events, [e['id'] for e in events])
+    rows = []
+    for e in events:
+        role_ids, role_names = links.get(e['id'], ((), ()))
+        rows.append({
+            'id': e['id'],
+            'name': e['name'],
+            'start_time': _fmt(_time, e['start_time']),
+            'end_time': _fmt(_time, e['end_time']),
+            'description': e['description'],
+            'is_active': e['is_active'],
+            'roles': list(role_ids),
+            'role_names': list(role_names),
+            'duration': 60,
+            'created_at': _fmt(_datetime, e['created_at']),
+            'updated_at': _fmt(_datetime, e['updated_at']),
+        })
+    return rows
+
+
+def roster_rows(queryset):
+    """Rows shaped like ``RostersSerializer(queryset, many=True).data``."""
+    rows = []
+    for r in queryset.values('id', 'event', 'event__name', 'date', 'created_at', 'updated_at'):
+        row = {'id': r['id'], 'event': r['event']}
+        # The serializer skips event_name entirely when the roster has no event.
+        if r['event'] is not None:
+            row['event_name'] = r['event__name']
+        row['date'] = _fmt(_date, r['date'])
+        row['created_at'] = _fmt(_datetime, r['created_at'])
+        row['updated_at'] = _fmt(_datetime, r['updated_at'])
+        rows.append(row)
+    return rows
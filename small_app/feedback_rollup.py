@@ -0,0 +1,82 @@
+from django.db import transaction
+from django.db.models import Max
+
+from .models import DailyFeedbackSummary, FeedbackShareLink, RosterFeedback
+
+
+def feedback_day_people(dates):
+    """Return ``{date: (present ids, absent ids, notes, recommendations)}`` for ``dates``.
+
+    A person counts as present for a day if any of their rows that day is
+    present. One query fetches the distinct (date, person, presence, note)
+    tuples for the requested dates on every backend; they are grouped here.
+    """
+    rows = RosterFeedback.objects.filter(roster__date__in=dates)
+    days = {d: (set(), set(), set(), set()) for d in dates}
+    for roster_date, person_id, is_present, note, recommendation in rows.values_list(
+        'roster__date', 'person_id', 'is_present', 'feedback', 'recommendations'
+    ).distinct():
+        present, absent, notes, recommendations = days[roster_date]
+        (present if is_present else absent).add(person_id)
+        if note:
+            notes.add(note)
+        if recommendation:
+            recommendations.add(recommendation)
+    for present, absent, _, _ in days.values():
+        absent -= present
+    return days
+
+
+def refresh_daily_feedback(dates):
+    """Rebuild the DailyFeedbackSummary rows for ``dates`` in a fixed number of queries.
+
+    Called after any write that adds, edits or removes feedback or a used
+    share link's note. Dates left without feedback lose their summary row.
+    """
+    dates = sorted({d for d in dates if d})
+    if not dates:
+        return
+
+    submitted = dict(
+        RosterFeedback.objects.filter(roster__date__in=dates)
+        .values('roster__date').annotate(submitted_at=Max('updated_at'))
+        .values_list('roster__date', 'submitted_at')
+    )
+    people = feedback_day_people(submitted)
+
+    # Day-level note preferred from the share link used for that date.
+    link_notes = {}
+    link_recommendations = {}
+    for link_date, note, recommendation in FeedbackShareLink.objects.filter(
+        is_used=True, date__in=submitted
+    ).values_list('date', 'global_feedback', 'global_recommendations'):
+        if note:
+            link_notes[link_date] = note
+        if recommendation:
+            link_recommendations[link_date] = recommendation
+
+    summaries = []
+    for day, submitted_at in submitted.items():
+        present, absent, notes, recommendations = people[day]
+        summaries.append(DailyFeedbackSummary(
+            date=day,
+            present_count=len(present),
+            absent_count=len(absent),
+            present_ids=sorted(present),
+            absent_ids=sorted(absent),
+            feedback=link_notes.get(day) or ' / '.join(sorted(notes)),
+            recommendations=link_recommendations.get(day) or ' / '.join(sorted(recommendations)),
+            submitted_at=submitted_at,
+        ))
+
+    with transaction.atomic():
+        DailyFeedbackSummary.objects.filter(date__in=dates).exclude(date__in=submitted).delete()
+        DailyFeedbackSummary.objects.bulk_create(
+            summaries,
+            update_conflicts=True,
+            unique_fields=['date'],
+            update_fields=[
+                'present_count', 'absent_count', 'present_ids', 'absent_ids',
+                'feedback', 'recommendations', 'submitted_at', 'updated_at',
+            ],
+        )
@@ -0,0 +1,232 @@
+"""Small DB-backed job queue for work too slow for a gunicorn request.
+
+Views enqueue a ``BackgroundJob`` and return 202; ``manage.py run_worker``
+claims queued jobs one at a time and runs the handler registered for the
+job's ``kind``. Handlers receive the job and may call ``report_progress``.
+
+A failed attempt is re-queued with an exponential ``run_after`` delay. Every
+job save touches ``updated_at``, so a RUNNING job left untouched for
+``JOB_STALE_AFTER`` seconds is taken to belong to a crashed worker and is
+reclaimed by the next ``claim_next``.
+"""
+import logging
+import traceback
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError
+from django.db.models import F, Q
+from django.utils import timezone
+
+from scheduling.services import generate_range
+
+from .bulk_import import import_csv_upload, import_json_upload
+from .models import BackgroundJob, MembersBulkUpload
+from .pdf import export_roster_pdf
+
+logger = logging.getLogger(__name__)
+
+HANDLERS = {}
+
+
+def job_handler(kind):
+    def register(func):
+        HANDLERS[kind] = func
+        return func
+    return register
+
+
+def find_job(idempotency_key):
+    if not idempotency_key:
+        return None
+    return BackgroundJob.objects.filter(idempotency_key=idempotency_key).first()
+
+
+def enqueue(kind, payload, idempotency_key=None, created_by=None, total_items=0, checked=False):
+    """Queue a job, or return the existing one for a repeated idempotency key.
+
+    Callers that already ran ``find_job`` for the key pass ``checked=True`` to
+    skip the second lookup; a concurrent duplicate is still caught on insert.
+    """
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind '{kind}'.")
+    existing = None if checked else find_job(idempotency_key)
+    if existing:
+        return existing
+    try:
+        return BackgroundJob.objects.create(
+            kind=kind,
+            payload=payload,
+            idempotency_key=idempotency_key or None,
+            created_by=created_by,
+            total_items=total_items,
+        )
+    except IntegrityError:
+        # A concurrent request with the same key won the insert.
+        return BackgroundJob.objects.get(idempotency_key=idempotency_key)
+
+
+def _stale_cutoff():
+    return timezone.now() - timedelta(seconds=settings.JOB_STALE_AFTER)
+
+
+def retry_delay(attempts):
+    """Backoff before the next attempt: ``JOB_RETRY_BACKOFF`` doubled per attempt made."""
+    return timedelta(seconds=settings.JOB_RETRY_BACKOFF * 2 ** max(attempts - 1, 0))
+
+
+def retry(job):
+    """Re-queue a failed or stalled job with a fresh attempt budget.
+
+    Returns False unless the job is FAILED or has been RUNNING without an
+    update for ``JOB_STALE_AFTER`` seconds.
+    """
+    requeued = BackgroundJob.objects.filter(
+        Q(status=BackgroundJob.FAILED)
+        | Q(status=BackgroundJob.RUNNING, updated_at__lt=_stale_cutoff()),
+        pk=job.pk,
+    ).update(
+        status=BackgroundJob.QUEUED,
+        attempts=0,
+        error=None,
+        processed_items=0,
+        run_after=None,
+        finished_at=None,
+        updated_at=timezone.now(),
+    )
+    return bool(requeued)
+
+
+def reclaim_stale():
+    """Re-queue (or fail, once out of attempts) RUNNING jobs whose worker has gone quiet.
+
+    Returns the number of jobs reclaimed.
+    """
+    now = timezone.now()
+    stale = BackgroundJob.objects.filter(status=BackgroundJob.RUNNING, updated_at__lt=_stale_cutoff())
+    error = f"Worker stopped responding (no update for {settings.JOB_STALE_AFTER}s)."
+    requeued = stale.filter(attempts__lt=F('max_attempts')).update(
+        status=BackgroundJob.QUEUED, error=error, run_after=now, updated_at=now,
+    )
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=BackgroundJob.FAILED, error=error, finished_at=now, updated_at=now,
+    )
+    if requeued or failed:
+        logger.warning("Reclaimed %d stale jobs (%d re-queued, %d failed)", requeued + failed, requeued, failed)
+    return requeued + failed
+
+
+def claim_next():
+    """Atomically claim the oldest due queued job, or return None when none is due.
+
+    Stale RUNNING jobs are reclaimed first. The conditional update only
+    succeeds for one worker, so several workers can poll the same table
+    without running a job twice.
+    """
+    reclaim_stale()
+    due = Q(status=BackgroundJob.QUEUED) & (Q(run_after__isnull=True) | Q(run_after__lte=timezone.now()))
+    for job_id in BackgroundJob.objects.filter(due).values_list('pk', flat=True)[:10]:
+        claimed = BackgroundJob.objects.filter(due, pk=job_id).update(
+            status=BackgroundJob.RUNNING,
+            started_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        if claimed:
+            return BackgroundJob.objects.get(pk=job_id)
+    return None
+
+
+def run_job(job):
+    """Run a claimed job and record its outcome, re-queueing it with backoff while attempts remain."""
+    job.attempts += 1
+    job.save(update_fields=['attempts', 'updated_at'])
+    try:
+        result = HANDLERS[job.kind](job)
+    except Exception as e:
+        logger.exception("Job %s (%s) failed on attempt %d", job.pk, job.kind, job.attempts)
+        job.error = f"{e}\n\n{traceback.format_exc()}"
+        if job.attempts < job.max_attempts:
+            job.status = BackgroundJob.QUEUED
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+            job.finished_at = None
+        else:
+            job.status = BackgroundJob.FAILED
+            job.finished_at = timezone.now()
+        job.save(update_fields=['error', 'status', 'run_after', 'finished_at', 'updated_at'])
+        return job
+
+    job.result = result
+    job.error = None
+    job.status = BackgroundJob.SUCCEEDED
+    job.finished_at = timezone.now()
+    job.save(update_fields=['result', 'error', 'status', 'finished_at', 'updated_at'])
+    return job
+
+
+def report_progress(job, processed, total=None):
+    job.processed_items = processed
+    fields = ['processed_items', 'updated_at']
+    if total is not None:
+        job.total_items = total
+        fields.append('total_items')
+    job.save(update_fields=fields)
+
+
+def job_payload(job):
+    return {
+        'id': job.pk,
+        'kind': job.kind,
+        'status': job.status,
+        'total_items': job.total_items,
+        'processed_items': job.processed_items,
+        'attempts': job.attempts,
+        'max_attempts': job.max_attempts,
+        'result': job.result,
+        'error': job.error.splitlines()[0] if job.error else None,
+        'has_output': bool(job.output),
+        'run_after': job.run_after.isoformat() if job.run_after else None,
+        'created_at': job.created_at.isoformat(),
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+# ──────────────────────────────────────────
+# Handlers
+# ──────────────────────────────────────────
+@job_handler('bulk_upload_persons')
+def _run_bulk_upload(job):
+    upload = MembersBulkUpload.objects.get(pk=job.payload['upload_id'])
+    if upload.source_file:
+        return import_csv_upload(upload, progress=lambda done: report_progress(job, done))
+    report_progress(job, 0, upload.number_of_records)
+    result = import_json_upload(upload)
+    report_progress(job, upload.number_of_records)
+    return result
+
+
+@job_handler('generate_range')
+def _run_generate_range(job):
+    payload = job.payload
+    rosters = generate_range(
+        datetime.strptime(payload['start_date'], '%Y-%m-%d').date(),
+        datetime.strptime(payload['end_date'], '%Y-%m-%d').date(),
+        payload.get('weekdays'),
+        save_to_db=payload.get('save_to_db', True),
+        engine=payload.get('engine', 'greedy'),
+        seed=payload.get('seed'),
+        progress=lambda done, total: report_progress(job, done, total),
+    )
+    return {'rosters': rosters}
+
+
+@job_handler('roster_pdf')
+def _run_roster_pdf(job):
+    roster_data = job.payload['roster_data']
+    pdf_bytes = export_roster_pdf(roster_data)
+    date_str = roster_data.get('date', 'roster')
+    if job.output:
+        job.output.delete(save=False)
+    job.output.save(f"roster_{date_str}.pdf", ContentFile(pdf_bytes), save=True)
+    return {'filename': f"roster_{date_str}.pdf"}
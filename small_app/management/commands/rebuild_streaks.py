@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from small_app.models import MemberStreak, RosterFeedback
+from small_app.streaks import current_streaks, write_streaks
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute every member's attendance streak from feedback history and repair "
+        "MemberStreak rows whose incremental state has drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Report drifted streaks without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        person_ids = sorted(
+            set(RosterFeedback.objects.values_list('person_id', flat=True).distinct())
+            | set(MemberStreak.objects.values_list('person_id', flat=True))
+        )
+        checked = drifted = 0
+        for start in range(0, len(person_ids), BATCH_SIZE):
+            batch = person_ids[start:start + BATCH_SIZE]
+            expected = current_streaks(batch)
+            existing = {s.person_id: s for s in MemberStreak.objects.filter(person_id__in=batch)}
+            repairs = {}
+            for person_id, (current, last_date) in expected.items():
+                streak = existing.get(person_id)
+                if (
+                    streak is None
+                    or streak.current_streak != current
+                    or streak.last_counted_date != last_date
+                    or streak.longest_streak < current
+                ):
+                    repairs[person_id] = (current, last_date)
+            checked += len(expected)
+            drifted += len(repairs)
+            if repairs and not options['dry_run']:
+                with transaction.atomic():
+                    write_streaks(repairs, existing)
+
+        action = "found" if options['dry_run'] else "repaired"
+        self.stdout.write(f"Checked {checked} streaks, {action} {drifted}.")
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from small_app.jobs import claim_next, run_job
+
+
+class Command(BaseCommand):
+    help = "Process queued background jobs (bulk uploads, batch generation, PDF export)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once', action='store_true',
+            help="Drain the queue and exit instead of polling forever.",
+        )
+        parser.add_argument(
+            '--sleep', type=float, default=2.0,
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Worker started.")
+        while True:
+            close_old_connections()
+            job = claim_next()
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['sleep'])
+                continue
+
+            self.stdout.write(f"Running job {job.pk} ({job.kind}), attempt {job.attempts + 1}")
+            job = run_job(job)
+            self.stdout.write(f"Job {job.pk} finished with status {job.status}")
+        self.stdout.write("Queue empty, exiting.")
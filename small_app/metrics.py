@@ -0,0 +1,119 @@
+"""Per-request latency and SQL instrumentation.
+
+``RequestMetricsMiddleware`` times every request, counts the SQL it runs and
+adds a ``Server-Timing`` header. Samples are kept per view in a bounded
+in-memory window (per process) and rendered in Prometheus text format by the
+``metrics`` view. Enable it with ``REQUEST_METRICS_ENABLED = True``.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class MetricsRegistry:
+    """Rolling per-view samples of (wall seconds, SQL count, SQL seconds)."""
+
+    def __init__(self, window):
+        self.window = window
+        self._samples = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def record(self, view, wall, sql_count, sql_time):
+        with self._lock:
+            samples = self._samples.get(view)
+            if samples is None:
+                samples = self._samples[view] = deque(maxlen=self.window)
+                self._totals[view] = [0, 0.0, 0, 0.0]
+            samples.append((wall, sql_count, sql_time))
+            totals = self._totals[view]
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += sql_count
+            totals[3] += sql_time
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+    def render_prometheus(self):
+        with self._lock:
+            snapshot = {view: (list(samples), list(self._totals[view])) for view, samples in self._samples.items()}
+
+        lines = []
+        metrics = (
+            ("http_request_duration_seconds", "Wall time per request.", 0, 1),
+            ("http_request_sql_queries", "SQL queries per request.", 1, 2),
+            ("http_request_sql_duration_seconds", "SQL time per request.", 2, 3),
+        )
+        for name, help_text, sample_index, total_index in metrics:
+            lines.append(f"# HELP {name} {help_text} Quantiles cover the last {self.window} requests.")
+            lines.append(f"# TYPE {name} summary")
+            for view in sorted(snapshot):
+                samples, totals = snapshot[view]
+                values = sorted(s[sample_index] for s in samples)
+                for q in QUANTILES:
+                    lines.append(f'{name}{{view="{view}",quantile="{q}"}} {_quantile(values, q):.6f}')
+                lines.append(f'{name}_sum{{view="{view}"}} {totals[total_index]:.6f}')
+                lines.append(f'{name}_count{{view="{view}"}} {totals[0]}')
+        return "\n".join(lines) + "\n"
+
+
+def _quantile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+registry = MetricsRegistry(getattr(settings, 'REQUEST_METRICS_WINDOW', 500))
+
+
+class _QueryTimer:
+    """``execute_wrapper`` hook that counts and times every SQL statement."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timer = _QueryTimer()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        wall = time.perf_counter() - started
+
+        match = getattr(request, 'resolver_match', None)
+        view = (match.view_name if match else None) or "unresolved"
+        registry.record(view, wall, timer.count, timer.duration)
+
+        response['Server-Timing'] = (
+            f'app;dur={wall * 1000:.1f}, '
+            f'db;dur={timer.duration * 1000:.1f};desc="{timer.count} queries"'
+        )
+        return response
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.5 on 2026-10-17 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+
+
+def backfill_assignment_counts(apps, schema_editor):
+    Assignment = apps.get_model('small_app', 'Assignment')
+    AssignmentCount = apps.get_model('small_app', 'AssignmentCount')
+    rows = (
+        Assignment.objects
+        .annotate(month=TruncMonth('roster__date'))
+        .values('person_id', 'role_id', 'month')
+        .annotate(count=Count('id'))
+    )
+    AssignmentCount.objects.bulk_create(
+        [AssignmentCount(**row) for row in rows], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('small_app', '0023_feedbacksharelink_global_recommendations_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssignmentCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignment_counts', to='small_app.persons')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignment_counts', to='small_app.roles')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['month'], name='small_app_a_month_7ee2b6_idx')],
+                'constraints': [models.UniqueConstraint(fields=('person', 'role', 'month'), name='unique_assignment_count_per_person_per_role_per_month')],
+            },
+        ),
+        migrations.RunPython(backfill_assignment_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('small_app', '0025_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='membersbulkupload',
+            name='source_file',
+            field=models.FileField(blank=True, null=True, upload_to='uploads/'),
+        ),
+        migrations.AlterField(
+            model_name='membersbulkupload',
+            name='json_data',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
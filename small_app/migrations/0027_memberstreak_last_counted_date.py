@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('small_app', '0026_membersbulkupload_source_file'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memberstreak',
+            name='last_counted_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:31
+
+from django.db import migrations, models
+
+
+def backfill_daily_feedback(apps, schema_editor):
+    RosterFeedback = apps.get_model('small_app', 'RosterFeedback')
+    FeedbackShareLink = apps.get_model('small_app', 'FeedbackShareLink')
+    DailyFeedbackSummary = apps.get_model('small_app', 'DailyFeedbackSummary')
+
+    days = {}
+    for day, person_id, is_present, note, recommendation, updated_at in RosterFeedback.objects.values_list(
+        'roster__date', 'person_id', 'is_present', 'feedback', 'recommendations', 'updated_at'
+    ).iterator():
+        present, absent, notes, recommendations, submitted = days.setdefault(
+            day, (set(), set(), set(), set(), [updated_at])
+        )
+        (present if is_present else absent).add(person_id)
+        if note:
+            notes.add(note)
+        if recommendation:
+            recommendations.add(recommendation)
+        submitted[0] = max(submitted[0], updated_at)
+
+    link_notes = {}
+    link_recommendations = {}
+    for day, note, recommendation in FeedbackShareLink.objects.filter(is_used=True).order_by(
+        '-created_at'
+    ).values_list('date', 'global_feedback', 'global_recommendations'):
+        if note:
+            link_notes[day] = note
+        if recommendation:
+            link_recommendations[day] = recommendation
+
+    summaries = []
+    for day, (present, absent, notes, recommendations, submitted) in days.items():
+        absent -= present
+        summaries.append(DailyFeedbackSummary(
+            date=day,
+            present_count=len(present),
+            absent_count=len(absent),
+            present_ids=sorted(present),
+            absent_ids=sorted(absent),
+            feedback=link_notes.get(day) or ' / '.join(sorted(notes)),
+            recommendations=link_recommendations.get(day) or ' / '.join(sorted(recommendations)),
+            submitted_at=submitted[0],
+        ))
+    DailyFeedbackSummary.objects.bulk_create(summaries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('small_app', '0027_memberstreak_last_counted_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyFeedbackSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('present_count', models.PositiveIntegerField(default=0)),
+                ('absent_count', models.PositiveIntegerField(default=0)),
+                ('present_ids', models.JSONField(default=list)),
+                ('absent_ids', models.JSONField(default=list)),
+                ('feedback', models.TextField(blank=True, default='')),
+                ('recommendations', models.TextField(blank=True, default='')),
+                ('submitted_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.RunPython(backfill_daily_feedback, migrations.RunPython.noop),
+    ]
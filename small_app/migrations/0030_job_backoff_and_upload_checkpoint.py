@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('small_app', '0029_cacheversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backgroundjob',
+            name='run_after',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='membersbulkupload',
+            name='error_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='membersbulkupload',
+            name='errors',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='membersbulkupload',
+            name='processed_records',
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -75,6 +75,46 @@ class Assignment(models.Model):
     def __str__(self):
         return f"{self.person} _ {self.role} on {self.roster.event.name} ({self.roster.date})"
     
+class AssignmentCount(models.Model):
+    """Rolling per-month assignment counter, kept in step with Assignment writes."""
+    person = models.ForeignKey(
+        Persons, on_delete=models.CASCADE, related_name='assignment_counts'
+    )
+    role = models.ForeignKey(
+        Roles, on_delete=models.CASCADE, related_name='assignment_counts'
+    )
+    # First day of the month the counted roster dates fall in.
+    month = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['person', 'role', 'month'],
+                name='unique_assignment_count_per_person_per_role_per_month'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['month']),
+        ]
+
+    def __str__(self):
+        return f"{self.person} _ {self.role} ({self.month:%Y-%m}): {self.count}"
+
+
+class CacheVersion(models.Model):
+    """Shared counter that versions cache keys for one family of cached data.
+
+    Kept in the database rather than the cache so a bump is seen by every
+    process, whatever cache backend each one uses.
+    """
+    name = models.CharField(max_length=50, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}: {self.version}"
+
+
 class AwardType(models.Model):
     """Dynamic list of award types (e.g. Day off, Appreciation email, Gift)."""
     name = models.CharField(max_length=150, unique=True)
@@ -164,12 +204,39 @@ class MemberStreak(models.Model):
     )
     current_streak = models.PositiveIntegerField(default=0)
     longest_streak = models.PositiveIntegerField(default=0)
+    # Latest roster date folded into current_streak; newer feedback advances
+    # the streak incrementally, anything on or before it forces a rescan.
+    last_counted_date = models.DateField(null=True, blank=True)
     last_updated = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.person} — streak: {self.current_streak}"
 
 
+class DailyFeedbackSummary(models.Model):
+    """One row per roster date summarising its feedback, kept in step by the feedback writers.
+
+    ``present_ids`` / ``absent_ids`` hold person ids (names are resolved when
+    read so renames show up); ``feedback`` / ``recommendations`` are the
+    day-level texts the summary endpoint shows, share-link note first.
+    """
+    date = models.DateField(unique=True)
+    present_count = models.PositiveIntegerField(default=0)
+    absent_count = models.PositiveIntegerField(default=0)
+    present_ids = models.JSONField(default=list)
+    absent_ids = models.JSONField(default=list)
+    feedback = models.TextField(blank=True, default='')
+    recommendations = models.TextField(blank=True, default='')
+    submitted_at = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.date}: {self.present_count} present, {self.absent_count} absent"
+
+
 class FeedbackShareLink(models.Model):
     """A one-time-use shareable link for collecting feedback for a roster date.
 
@@ -198,11 +265,66 @@ class FeedbackShareLink(models.Model):
 
 
 class MembersBulkUpload(models.Model):
-    json_data = models.JSONField()
+    # JSON uploads keep their rows here; CSV uploads keep the raw file instead.
+    json_data = models.JSONField(null=True, blank=True)
+    source_file = models.FileField(upload_to='uploads/', null=True, blank=True)
     status = models.BooleanField(default=False)
     number_of_records = models.IntegerField(default=0)
     success_products = models.IntegerField(default=0)
     failed_products = models.IntegerField(default=0)
+    # Import checkpoint: rows already committed, so a retried job resumes after them.
+    processed_records = models.IntegerField(default=0)
+    error_count = models.IntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
     created_at = models.DateField(auto_now_add=True)
     updated_at = models.DateField(auto_now=True)
-    
+
+
+class BackgroundJob(models.Model):
+    """Queued long-running work (bulk imports, batch generation, PDF export).
+
+    Picked up by ``manage.py run_worker``. Like MembersBulkUpload it carries
+    status and counter fields so clients can poll progress. A failed job is
+    re-queued after a growing ``run_after`` delay until ``max_attempts`` is
+    reached, and a RUNNING job whose worker stops touching ``updated_at`` for
+    ``JOB_STALE_AFTER`` seconds is reclaimed the same way. Handlers are
+    idempotent so a retry never double-applies work.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=50)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    payload = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    output = models.FileField(upload_to='jobs/', null=True, blank=True)
+    error = models.TextField(blank=True, null=True)
+    idempotency_key = models.CharField(max_length=100, unique=True, null=True, blank=True)
+    total_items = models.IntegerField(default=0)
+    processed_items = models.IntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='jobs_created',
+    )
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['created_at']
+
+    def __str__(self):
+        return f"BackgroundJob({self.kind}, {self.status})"
+
@@ -0,0 +1,130 @@
+"""Composite keyset pagination for the opt-in ``?pagination=cursor`` lists.
+
+DRF's ``CursorPagination`` positions on the first ordering field only and
+breaks ties with an offset, so rows inserted between requests can shift a
+page. ``KeysetPagination`` encodes every ordering value of the boundary row in
+the cursor and filters on the full tuple, ``(a, id) > (cursor_a, cursor_id)``,
+so each page starts exactly after the last row the client saw.
+"""
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Keyset pagination: every page costs the same, with no COUNT(*) or OFFSET scan.
+
+    ``ordering`` is set per list; its fields must be non-null and the last one
+    unique (``id``). The response matches ``CursorPagination``:
+    ``{"next", "previous", "results"}``.
+    """
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 70
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    ordering = ('id',)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        fields = [(field.lstrip('-'), field.startswith('-')) for field in self.ordering]
+        values, reverse = self.decode_cursor(request, len(fields))
+        if values is not None:
+            values = self._to_python(queryset, fields, values)
+
+        # Walking backwards flips every direction, then the page is flipped back.
+        queryset = queryset.order_by(*[
+            f"{'-' if descending != reverse else ''}{name}" for name, descending in fields
+        ])
+        if values is not None:
+            queryset = queryset.filter(self._after(fields, values, reverse))
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = values is not None if reverse else has_more
+        has_previous = has_more if reverse else values is not None
+        self.next_values = self._key(rows[-1], fields) if rows and has_next else None
+        self.previous_values = self._key(rows[0], fields) if rows and has_previous else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_link(self.next_values, reverse=False),
+            'previous': self.get_link(self.previous_values, reverse=True),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    @staticmethod
+    def _after(fields, values, reverse):
+        """``(a, b, id) > (x, y, z)`` spelled out: a > x, or a = x and b > y, or ..."""
+        condition = Q()
+        for i, (name, descending) in enumerate(fields):
+            lookup = 'lt' if descending != reverse else 'gt'
+            step = Q(**{f"{name}__{lookup}": values[i]})
+            for (prior, _), value in zip(fields[:i], values):
+                step &= Q(**{prior: value})
+            condition |= step
+        return condition
+
+    def _to_python(self, queryset, fields, values):
+        """Convert cursor values with each ordering field, so a tampered cursor is a 404, not a 500."""
+        try:
+            converted = [
+                self._model_field(queryset, name).to_python(value)
+                for (name, _), value in zip(fields, values)
+            ]
+        except (ValueError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        # Ordering fields are non-null, so a null can only come from a forged cursor.
+        if any(value is None for value in converted):
+            raise NotFound(self.invalid_cursor_message)
+        return converted
+
+    @staticmethod
+    def _model_field(queryset, name):
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        return queryset.model._meta.get_field(name)
+
+    @staticmethod
+    def _key(row, fields):
+        return [getattr(row, name) for name, _ in fields]
+
+    def get_link(self, values, reverse):
+        if values is None:
+            return None
+        payload = json.dumps({'v': values, 'r': reverse}, cls=DjangoJSONEncoder)
+        token = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, token)
+
+    def decode_cursor(self, request, width):
+        """Return ``(values, reverse)`` from the request's cursor, or ``(None, False)`` without one."""
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+            values, reverse = cursor['v'], bool(cursor['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != width:
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
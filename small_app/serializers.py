@@ -6,6 +6,24 @@ from .models import (
 )
 
 
+class EagerLoadingMixin:
+    """Lets a serializer declare the joins its fields read.
+
+    List views pass their queryset through ``setup_eager_loading`` so a page
+    costs a fixed number of queries however many rows it holds.
+    """
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+        return queryset
+
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -16,7 +34,9 @@ class UserSerializer(serializers.ModelSerializer):
         return User.objects.create_user(**validated_data)
 
 
-class PersonsSerializer(serializers.ModelSerializer):
+class PersonsSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    prefetch_related_fields = ('roles',)
+
     roles = serializers.PrimaryKeyRelatedField(
         many=True,
         queryset=Roles.objects.all(),
@@ -66,7 +86,9 @@ class RolesSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'is_special_role', 'max_assignments', 'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at']
 
-class EventsSerializer(serializers.ModelSerializer):
+class EventsSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    prefetch_related_fields = ('roles',)
+
     # Add duration field for Flutter app compatibility
     duration = serializers.SerializerMethodField()
     roles = serializers.PrimaryKeyRelatedField(
@@ -88,7 +110,9 @@ class EventsSerializer(serializers.ModelSerializer):
         # Return duration in minutes - you can customize this logic
         return 60  # Default 60 minutes
 
-class RostersSerializer(serializers.ModelSerializer):
+class RostersSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ('event',)
+
     event_name = serializers.CharField(source='event.name', read_only=True)
 
     class Meta:
@@ -96,7 +120,9 @@ class RostersSerializer(serializers.ModelSerializer):
         fields = ['id', 'event', 'event_name', 'date', 'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at']
 
-class AssignmentSerializer(serializers.ModelSerializer):
+class AssignmentSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ('person', 'role', 'roster__event')
+
     person_name = serializers.SerializerMethodField()
     role_name = serializers.CharField(source='role.name', read_only=True)
     event_name = serializers.CharField(source='roster.event.name', read_only=True)
@@ -117,7 +143,9 @@ class AwardTypeSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class AwardSerializer(serializers.ModelSerializer):
+class AwardSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ('person', 'award_type', 'given_by')
+
     person_name = serializers.SerializerMethodField()
     award_type_name = serializers.CharField(source='award_type.name', read_only=True)
     given_by_name = serializers.SerializerMethodField()
@@ -147,7 +175,9 @@ class AwardSerializer(serializers.ModelSerializer):
         return full or u.username
 
 
-class RosterFeedbackSerializer(serializers.ModelSerializer):
+class RosterFeedbackSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    select_related_fields = ('person', 'roster__event')
+
     person_name = serializers.SerializerMethodField()
     roster_date = serializers.DateField(source='roster.date', read_only=True)
     event_name = serializers.CharField(source='roster.event.name', read_only=True)
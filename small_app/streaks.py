@@ -0,0 +1,126 @@
+"""Attendance-streak maintenance for MemberStreak.
+
+Feedback writes call ``update_streaks`` with the rows they saved. A person
+whose new rows are all dated after ``last_counted_date`` is advanced in
+memory from the stored streak; anyone else (no streak yet, or an older date
+was edited) is rescanned from history with ``current_streaks``. A day with any
+absence resets the streak, otherwise each present row on it adds one. An
+award also resets it: only feedback dated after the latest award counts.
+"""
+from collections import defaultdict
+
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .models import Award, MemberStreak, Persons, RosterFeedback
+
+
+def current_streaks(person_ids):
+    """Return ``{person_id: (current streak, latest feedback date)}`` in one query.
+
+    A person's current streak is the trailing island of present rows: every
+    feedback row dated after both their most recent absence and their most
+    recent award (all rows if they have neither). Those two dates come from
+    correlated subqueries, so the query costs the same on SQLite and
+    PostgreSQL and never ships a person's history to Python.
+    """
+    last_absence = (
+        RosterFeedback.objects
+        .filter(person=OuterRef('pk'), is_present=False)
+        .order_by('-roster__date')
+        .values('roster__date')[:1]
+    )
+    last_award = Award.objects.filter(person=OuterRef('pk')).order_by('-given_at').values('given_at')[:1]
+    return {
+        pk: (current, latest)
+        for pk, current, latest in Persons.objects
+        .filter(pk__in=set(person_ids))
+        .annotate(last_absence=Subquery(last_absence), last_award=Subquery(last_award))
+        .annotate(
+            current=Count(
+                'feedback',
+                filter=(
+                    (Q(last_absence__isnull=True) | Q(feedback__roster__date__gt=F('last_absence')))
+                    & (Q(last_award__isnull=True) | Q(feedback__roster__date__gt=F('last_award')))
+                ),
+            ),
+            latest=Max('feedback__roster__date'),
+        )
+        .values_list('pk', 'current', 'latest')
+    }
+
+
+def recalculate_streaks(person_ids):
+    """Recompute MemberStreak from full history for many people in a fixed number of queries."""
+    values = current_streaks(person_ids)
+    if values:
+        write_streaks(values, {s.person_id: s for s in MemberStreak.objects.filter(person_id__in=values)})
+
+
+def update_streaks(entries):
+    """Fold freshly saved feedback into MemberStreak.
+
+    ``entries`` is an iterable of ``(person_id, roster_date, is_present)`` for
+    the rows just written. People whose rows are not all strictly newer than
+    both their ``last_counted_date`` and their latest award are rescanned; an
+    award resets the streak, so a row dated on or before it must not extend it.
+    """
+    days_by_person = defaultdict(lambda: defaultdict(list))
+    for person_id, roster_date, is_present in entries:
+        days_by_person[person_id][roster_date].append(bool(is_present))
+    if not days_by_person:
+        return
+
+    last_award = Award.objects.filter(person=OuterRef('person_id')).order_by('-given_at').values('given_at')[:1]
+    existing = {
+        s.person_id: s
+        for s in MemberStreak.objects.filter(person_id__in=days_by_person).annotate(last_award=Subquery(last_award))
+    }
+    values = {}
+    rescan = []
+    for person_id, days in days_by_person.items():
+        streak = existing.get(person_id)
+        if (
+            streak is None
+            or streak.last_counted_date is None
+            or min(days) <= streak.last_counted_date
+            or (streak.last_award is not None and min(days) <= streak.last_award)
+        ):
+            rescan.append(person_id)
+            continue
+        current = streak.current_streak
+        for day in sorted(days):
+            current = current + len(days[day]) if all(days[day]) else 0
+        values[person_id] = (current, max(days))
+
+    if rescan:
+        values.update(current_streaks(rescan))
+    write_streaks(values, existing)
+
+
+def write_streaks(values, existing):
+    """Persist ``{person_id: (current, last date)}``; ``longest_streak`` stays a high-water mark."""
+    now = timezone.now()
+    to_update = []
+    to_create = []
+    for person_id, (current, last_date) in values.items():
+        streak = existing.get(person_id)
+        if streak is None:
+            to_create.append(MemberStreak(
+                person_id=person_id, current_streak=current, longest_streak=current,
+                last_counted_date=last_date,
+            ))
+            continue
+        streak.current_streak = current
+        streak.longest_streak = max(streak.longest_streak, current)
+        streak.last_counted_date = last_date
+        streak.last_updated = now
+        to_update.append(streak)
+
+    if to_update:
+        MemberStreak.objects.bulk_update(
+            to_update, ['current_streak', 'longest_streak', 'last_counted_date', 'last_updated']
+        )
+    if to_create:
+        # A concurrent submission may have created the row first; it carries the same values.
+        MemberStreak.objects.bulk_create(to_create, ignore_conflicts=True)
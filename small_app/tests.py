@@ -1,9 +1,35 @@
+import base64
+import io
+import json
+import shutil
+import tempfile
+from datetime import date, time, timedelta
+
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
-from small_app.models import Persons
+from small_app.bulk_import import import_csv_upload, import_persons_stream, iter_csv_records
+from small_app.cache_versions import get_version
+from small_app.fast_lists import event_rows, person_rows, role_rows, roster_rows
+from small_app.feedback_rollup import refresh_daily_feedback
+from small_app.jobs import claim_next, enqueue, reclaim_stale, run_job
+from small_app.metrics import registry
+from small_app.models import (
+    Assignment, Award, AwardType, BackgroundJob, DailyFeedbackSummary, Events, FeedbackShareLink, MembersBulkUpload, MemberStreak, Persons,
+    Roles, RosterFeedback, Rosters,
+)
+from small_app.serializers import EventsSerializer, PersonsSerializer, RolesSerializer, RostersSerializer
+from small_app.streaks import current_streaks, recalculate_streaks, update_streaks
 
 User = get_user_model()
 
@@ -74,5 +100,768 @@ class TestEditMemberDetails(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("first_name", response.json())
         self.assertIn("email", response.json())
-       
-    
\ No newline at end of file
+
+
+@override_settings(REQUEST_METRICS_ENABLED=True)
+class TestRequestMetrics(APITestCase):
+    def setUp(self):
+        registry.reset()
+        self.user = User.objects.create_user(username="admin", password="TestPass123")
+
+    def test_response_carries_server_timing(self):
+        response = self.client.get(reverse("active_members"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("db;dur=", response["Server-Timing"])
+
+    def test_metrics_requires_authentication(self):
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_metrics_lists_recorded_views(self):
+        self.client.get(reverse("active_members"))
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse("metrics"))
+        body = response.content.decode()
+        self.assertIn('http_request_sql_queries_count{view="active_members"} 1', body)
+        self.assertIn('http_request_duration_seconds{view="active_members",quantile="0.99"}', body)
+
+
+class TestBulkUploadPersons(APITestCase):
+    def setUp(self):
+        Roles.objects.create(name="Camera")
+        Persons.objects.create(first_name="Taken", last_name="Email", email="taken@example.com")
+
+    def test_bulk_upload_resolves_roles_and_reports_row_errors(self):
+        data = [
+            {"first_name": "Ann", "last_name": "One", "roles": "camera, Sound", "is_producer": "true"},
+            {"first_name": "Ben", "last_name": "Two", "email": "taken@example.com"},
+            {"last_name": "Nameless"},
+            {"first_name": "Cat", "last_name": "Three", "roles": ["SOUND"], "contact": 712345678},
+        ]
+        response = self.client.post(reverse("bulk_upload_persons"), {"data": data}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        body = response.json()
+        self.assertEqual(body["successful_uploads"], 2)
+        self.assertEqual([e["row"] for e in body["errors"]], [2, 3])
+        self.assertEqual(Roles.objects.filter(name__iexact="sound").count(), 1)
+
+        ann = Persons.objects.get(email="ann.one@gmail.com")
+        self.assertTrue(ann.is_producer)
+        self.assertEqual(sorted(ann.roles.values_list('name', flat=True)), ["Camera", "Sound"])
+        self.assertEqual(Persons.objects.get(first_name="Cat").phone_number, "712345678")
+
+        upload = MembersBulkUpload.objects.get()
+        self.assertEqual((upload.success_products, upload.failed_products), (2, 2))
+
+    def test_bulk_upload_query_count_is_constant(self):
+        data = [
+            {"first_name": f"Member{i}", "last_name": "Test", "roles": "Camera, Sound"}
+            for i in range(50)
+        ]
+        with self.assertNumQueries(12):
+            response = self.client.post(reverse("bulk_upload_persons"), {"data": data}, format='json')
+        self.assertEqual(response.json()["successful_uploads"], 50)
+
+
+class TestBackgroundJobs(APITestCase):
+    def setUp(self):
+        Roles.objects.create(name="Camera")
+
+    def test_async_bulk_upload_is_queued_and_processed_by_worker(self):
+        data = [{"first_name": f"Member{i}", "last_name": "Async", "roles": "Camera"} for i in range(3)]
+        response = self.client.post(
+            reverse("bulk_upload_persons"), {"data": data, "async": True},
+            format='json', HTTP_IDEMPOTENCY_KEY="upload-1",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.json()["status"], BackgroundJob.QUEUED)
+        self.assertFalse(Persons.objects.filter(last_name="Async").exists())
+
+        repeat = self.client.post(
+            reverse("bulk_upload_persons"), {"data": data, "async": True},
+            format='json', HTTP_IDEMPOTENCY_KEY="upload-1",
+        )
+        self.assertEqual(repeat.json()["id"], response.json()["id"])
+        self.assertEqual(MembersBulkUpload.objects.count(), 1)
+
+        run_job(claim_next())
+        self.assertIsNone(claim_next())
+
+        detail = self.client.get(reverse("job_detail", args=[response.json()["id"]])).json()
+        self.assertEqual(detail["status"], BackgroundJob.SUCCEEDED)
+        self.assertEqual((detail["processed_items"], detail["total_items"]), (3, 3))
+        self.assertEqual(detail["result"]["successful_uploads"], 3)
+        self.assertEqual(Persons.objects.filter(last_name="Async").count(), 3)
+
+    def test_async_upload_looks_up_idempotency_key_once(self):
+        data = [{"first_name": "Once", "last_name": "Async"}]
+        for _ in range(2):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    reverse("bulk_upload_persons"), {"data": data, "async": True},
+                    format='json', HTTP_IDEMPOTENCY_KEY="upload-once",
+                )
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            lookups = [
+                q for q in queries.captured_queries
+                if q['sql'].startswith('SELECT') and '"small_app_backgroundjob"."idempotency_key" =' in q['sql']
+            ]
+            self.assertEqual(len(lookups), 1)
+        self.assertEqual(BackgroundJob.objects.count(), 1)
+
+    def test_failed_job_can_be_retried(self):
+        job = enqueue('bulk_upload_persons', {'upload_id': 999})
+        for attempt in range(job.max_attempts):
+            run_job(claim_next())
+            if attempt < job.max_attempts - 1:
+                # Backed off: not claimable until run_after passes.
+                self.assertIsNone(claim_next())
+                BackgroundJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (BackgroundJob.FAILED, job.max_attempts))
+
+        response = self.client.post(reverse("job_retry", args=[job.pk]))
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.json()["status"], BackgroundJob.QUEUED)
+
+        again = self.client.post(reverse("job_retry", args=[job.pk]))
+        self.assertEqual(again.status_code, status.HTTP_409_CONFLICT)
+
+    @override_settings(JOB_RETRY_BACKOFF=10)
+    def test_backoff_doubles_per_attempt(self):
+        job = enqueue('bulk_upload_persons', {'upload_id': 999})
+        delays = []
+        for _ in range(2):
+            before = timezone.now()
+            job = run_job(claim_next())
+            delays.append(round((job.run_after - before).total_seconds()))
+            BackgroundJob.objects.filter(pk=job.pk).update(run_after=None)
+        self.assertEqual(delays, [10, 20])
+
+    @override_settings(JOB_STALE_AFTER=60)
+    def test_stale_running_job_is_reclaimed_or_retried(self):
+        stalled = timezone.now() - timedelta(minutes=5)
+        job = enqueue('roster_pdf', {'roster_data': {}})
+        spent = enqueue('roster_pdf', {'roster_data': {}})
+        BackgroundJob.objects.filter(pk=job.pk).update(status=BackgroundJob.RUNNING, attempts=1, updated_at=stalled)
+        BackgroundJob.objects.filter(pk=spent.pk).update(status=BackgroundJob.RUNNING, attempts=3, updated_at=stalled)
+        fresh = enqueue('roster_pdf', {'roster_data': {}})
+        BackgroundJob.objects.filter(pk=fresh.pk).update(status=BackgroundJob.RUNNING, attempts=1)
+
+        self.assertEqual(self.client.post(reverse("job_retry", args=[fresh.pk])).status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(self.client.post(reverse("job_retry", args=[spent.pk])).status_code, status.HTTP_202_ACCEPTED)
+        BackgroundJob.objects.filter(pk=spent.pk).update(status=BackgroundJob.RUNNING, attempts=3, updated_at=stalled)
+
+        self.assertEqual(reclaim_stale(), 2)
+        statuses = dict(BackgroundJob.objects.values_list('pk', 'status'))
+        self.assertEqual(
+            (statuses[job.pk], statuses[spent.pk], statuses[fresh.pk]),
+            (BackgroundJob.QUEUED, BackgroundJob.FAILED, BackgroundJob.RUNNING),
+        )
+
+    def test_rerun_upload_job_keeps_first_run_counts(self):
+        data = [{"first_name": f"Member{i}", "last_name": "Rerun", "roles": "Camera"} for i in range(3)]
+        response = self.client.post(reverse("bulk_upload_persons"), {"data": data, "async": True}, format='json')
+        job = run_job(claim_next())
+        # As if the worker died after the import committed but before the job was marked done.
+        BackgroundJob.objects.filter(pk=job.pk).update(status=BackgroundJob.FAILED)
+        self.client.post(reverse("job_retry", args=[response.json()["id"]]))
+        job = run_job(claim_next())
+
+        self.assertEqual(job.result["successful_uploads"], 3)
+        self.assertEqual(job.result["errors"], [])
+        upload = MembersBulkUpload.objects.get()
+        self.assertEqual((upload.success_products, upload.failed_products), (3, 0))
+
+
+class TestBulkUploadPersonsCsv(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        Roles.objects.create(name="Camera")
+
+    def test_csv_upload_is_stored_on_disk_and_imported(self):
+        csv_bytes = (
+            "\ufeffFirst Name,Last Name,Email,Roles,Is Producer\n"
+            "Ann,One,,\"Camera, Sound\",true\n"
+            ",,,,\n"
+            "Ben,Two,ben@example.com,,\n"
+            ",Nameless,,,\n"
+        ).encode("utf-8")
+        response = self.client.post(
+            reverse("bulk_upload_persons_csv"),
+            {"file": SimpleUploadedFile("members.csv", csv_bytes, content_type="text/csv")},
+            format='multipart',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        body = response.json()
+        self.assertEqual((body["total_records"], body["successful_uploads"]), (3, 2))
+        self.assertEqual([e["row"] for e in body["errors"]], [3])
+        self.assertTrue(Persons.objects.get(email="ann.one@gmail.com").is_producer)
+
+        upload = MembersBulkUpload.objects.get()
+        self.assertIsNone(upload.json_data)
+        with upload.source_file.open('rb') as fh:
+            self.assertEqual(fh.read(), csv_bytes)
+
+    def test_rejects_non_csv_file(self):
+        response = self.client.post(
+            reverse("bulk_upload_persons_csv"),
+            {"file": SimpleUploadedFile("members.xlsx", b"PK\x03\x04")},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stream_numbers_rows_across_chunks(self):
+        rows = "first_name,last_name,email\n" + "".join(
+            f"M{i},Chunk,{'dup' if i in (1, 4) else i}@example.com\n" for i in range(5)
+        )
+        progress = []
+        total, created, error_count, errors = import_persons_stream(
+            iter_csv_records(io.BytesIO(rows.encode())), chunk_size=2, progress=progress.append,
+        )
+        self.assertEqual((total, created, error_count), (5, 4, 1))
+        self.assertEqual(errors[0]["row"], 5)
+        self.assertEqual(progress, [2, 4, 5])
+
+    def test_csv_import_resumes_after_checkpoint(self):
+        upload = MembersBulkUpload(json_data=None)
+        upload.source_file.save("members.csv", io.BytesIO(
+            b"first_name,last_name\nAnn,One\nBen,Two\nCat,Three\n"
+        ), save=False)
+        # The first row's chunk committed before the worker died.
+        Persons.objects.create(first_name="Ann", last_name="One", email="ann.one@gmail.com")
+        upload.processed_records = upload.success_products = 1
+        upload.save()
+
+        result = import_csv_upload(upload)
+        self.assertEqual((result["total_records"], result["successful_uploads"], result["errors"]), (3, 3, []))
+        self.assertEqual(Persons.objects.filter(email__endswith="@gmail.com").count(), 3)
+
+
+class TestStreaks(APITestCase):
+    def setUp(self):
+        self.event = Events.objects.create(name="Sunday Service")
+        self.people = [
+            Persons.objects.create(first_name=f"P{i}", last_name="Streak", email=f"p{i}@example.com")
+            for i in range(3)
+        ]
+        self.rosters = [
+            Rosters.objects.create(event=self.event, date=date(2026, 1, 4) + timedelta(weeks=w))
+            for w in range(4)
+        ]
+        # P0: present, absent, present; P1: always present; P2: no history.
+        for roster, present in zip(self.rosters, (True, False, True)):
+            RosterFeedback.objects.create(roster=roster, person=self.people[0], is_present=present)
+        for roster in self.rosters[:3]:
+            RosterFeedback.objects.create(roster=roster, person=self.people[1], is_present=True)
+        MemberStreak.objects.create(person=self.people[1], current_streak=0, longest_streak=7)
+
+    def submit(self, presence, roster=None):
+        return self.client.post(
+            reverse("submit_feedback", args=[(roster or self.rosters[3]).pk]),
+            {"feedback": [{"person_id": p.pk, "is_present": present} for p, present in zip(self.people, presence)]},
+            format='json',
+        )
+
+    def streak(self, person):
+        s = MemberStreak.objects.get(person=person)
+        return s.current_streak, s.longest_streak
+
+    def test_submit_feedback_recalculates_streaks_in_batch(self):
+        self.assertEqual(self.submit((True, True, False)).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.streak(self.people[0]), (2, 2))
+        self.assertEqual(self.streak(self.people[1]), (4, 7))
+        self.assertEqual(self.streak(self.people[2]), (0, 0))
+
+        self.submit((False, True, True))
+        self.assertEqual(self.streak(self.people[0]), (0, 2))
+        self.assertEqual(self.streak(self.people[2]), (1, 1))
+
+    def test_streak_queries_do_not_grow_with_people(self):
+        self.submit((True, True, True))
+        with self.assertNumQueries(3):
+            recalculate_streaks([p.pk for p in self.people])
+
+    def test_newer_feedback_advances_streak_without_rescan(self):
+        self.submit((True, True, False))
+        later = Rosters.objects.create(event=self.event, date=date(2026, 2, 8))
+        with self.assertNumQueries(2):
+            update_streaks([(self.people[0].pk, later.date, True), (self.people[2].pk, later.date, True)])
+        self.assertEqual(self.streak(self.people[0]), (3, 3))
+        self.assertEqual(self.streak(self.people[2]), (1, 1))
+        self.assertEqual(MemberStreak.objects.get(person=self.people[0]).last_counted_date, later.date)
+
+    def test_editing_an_older_date_rescans(self):
+        self.submit((True, True, True))
+        self.submit((True,), roster=self.rosters[1])
+        self.assertEqual(self.streak(self.people[0]), (4, 4))
+
+    def test_rebuild_streaks_repairs_drift(self):
+        self.submit((True, True, True))
+        MemberStreak.objects.filter(person=self.people[1]).update(current_streak=1, last_counted_date=None)
+
+        out = io.StringIO()
+        call_command("rebuild_streaks", "--dry-run", stdout=out)
+        self.assertIn("found 1", out.getvalue())
+        self.assertEqual(self.streak(self.people[1]), (1, 7))
+
+        call_command("rebuild_streaks", stdout=io.StringIO())
+        self.assertEqual(self.streak(self.people[1]), (4, 7))
+
+    def test_feedback_dated_before_a_newer_award_does_not_extend_streak(self):
+        self.submit((True, True, True))
+        award_type = AwardType.objects.create(name="Day off")
+        self.client.post(reverse("awards"), {
+            "person": self.people[0].pk, "award_type": award_type.pk, "given_at": "2026-02-12",
+        }, format='json')
+        # Newer than last_counted_date (2026-01-25) but still before the award.
+        before_award = Rosters.objects.create(event=self.event, date=date(2026, 2, 11))
+        after_award = Rosters.objects.create(event=self.event, date=date(2026, 2, 15))
+        self.submit((True, True, True), roster=before_award)
+        self.submit((True, True, True), roster=after_award)
+
+        expected = current_streaks([p.pk for p in self.people])
+        for person in self.people:
+            streak = MemberStreak.objects.get(person=person)
+            self.assertEqual((streak.current_streak, streak.last_counted_date), expected[person.pk])
+        self.assertEqual(self.streak(self.people[0])[0], 1)
+
+    def test_award_reset_survives_rescan_and_rebuild(self):
+        self.submit((True, True, True))
+        award_type = AwardType.objects.create(name="Day off")
+        response = self.client.post(reverse("awards"), {
+            "person": self.people[1].pk, "award_type": award_type.pk, "given_at": "2026-01-25",
+        }, format='json')
+        self.assertEqual(response.json()["streak_at_award"], 4)
+        self.assertEqual(self.streak(self.people[1]), (0, 7))
+
+        recalculate_streaks([self.people[1].pk])
+        self.assertEqual(self.streak(self.people[1]), (0, 7))
+        out = io.StringIO()
+        call_command("rebuild_streaks", "--dry-run", stdout=out)
+        self.assertIn("found 0", out.getvalue())
+
+        # Attendance after the award starts a fresh streak; deleting the award restores the old one.
+        later = Rosters.objects.create(event=self.event, date=date(2026, 2, 1))
+        self.submit((True, True, True), roster=later)
+        self.assertEqual(self.streak(self.people[1]), (1, 7))
+        self.client.delete(reverse("award_detail", args=[response.json()["id"]]))
+        self.assertEqual(self.streak(self.people[1]), (5, 7))
+
+
+class TestSubmitFeedback(APITestCase):
+    def setUp(self):
+        event = Events.objects.create(name="Sunday Service")
+        self.roster = Rosters.objects.create(event=event, date=date(2026, 1, 4))
+        self.people = [
+            Persons.objects.create(first_name=f"F{i}", last_name="Feedback", email=f"f{i}@example.com")
+            for i in range(20)
+        ]
+        RosterFeedback.objects.create(roster=self.roster, person=self.people[0], is_present=False, feedback="old")
+
+    def test_upsert_reports_created_and_updated(self):
+        items = [{"person_id": p.pk, "is_present": True, "feedback": "ok", "rating": 4} for p in self.people[:3]]
+        items.append({"person_id": str(self.people[1].pk), "is_present": False})
+        response = self.client.post(
+            reverse("submit_feedback", args=[self.roster.pk]), {"feedback": items}, format='json',
+        )
+
+        self.assertEqual(response.json()["created"], 2)
+        self.assertEqual(response.json()["updated"], 2)
+        first = RosterFeedback.objects.get(roster=self.roster, person=self.people[0])
+        self.assertEqual((first.is_present, first.feedback, first.rating), (True, "ok", 4))
+        self.assertFalse(RosterFeedback.objects.get(roster=self.roster, person=self.people[1]).is_present)
+        self.assertEqual(RosterFeedback.objects.filter(roster=self.roster).count(), 3)
+
+    def test_query_count_does_not_grow_with_people(self):
+        def submit(people):
+            return self.client.post(
+                reverse("submit_feedback", args=[self.roster.pk]),
+                {"feedback": [{"person_id": p.pk, "is_present": True} for p in people]},
+                format='json',
+            )
+
+        with CaptureQueriesContext(connection) as few:
+            submit(self.people[:2])
+        with CaptureQueriesContext(connection) as many:
+            submit(self.people[2:])
+        self.assertEqual(len(few), len(many))
+
+
+class TestFeedbackShareSubmit(APITestCase):
+    def setUp(self):
+        self.day = date(2026, 1, 4)
+        role = Roles.objects.create(name="Camera")
+        other_role = Roles.objects.create(name="Sound")
+        self.people = [
+            Persons.objects.create(first_name=f"S{i}", last_name="Share", email=f"s{i}@example.com")
+            for i in range(6)
+        ]
+        for i, name in enumerate(("Morning", "Evening")):
+            roster = Rosters.objects.create(event=Events.objects.create(name=name), date=self.day)
+            for person in self.people[i * 2:i * 2 + 4]:
+                Assignment.objects.create(roster=roster, role=role, person=person)
+            # The same person in two roles still gets a single feedback row.
+            Assignment.objects.create(roster=roster, role=other_role, person=self.people[i * 2])
+
+    def make_link(self, token):
+        return FeedbackShareLink.objects.create(token=token, date=self.day)
+
+    def submit(self, token, absent=()):
+        return self.client.post(
+            reverse("feedback_share_submit", args=[token]),
+            {
+                "attendance": [{"person_id": p.pk, "is_present": p not in absent} for p in self.people],
+                "global_feedback": "Good day",
+            },
+            format='json',
+        )
+
+    def test_submit_upserts_every_pair_and_claims_link_once(self):
+        self.make_link("tok")
+        response = self.submit("tok", absent=(self.people[2],))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["affected_members"], 6)
+
+        rows = RosterFeedback.objects.filter(roster__date=self.day)
+        self.assertEqual(rows.count(), 8)
+        self.assertEqual(set(rows.filter(is_present=False).values_list('person_id', flat=True)), {self.people[2].pk})
+        self.assertEqual(set(rows.values_list('feedback', flat=True)), {"Good day"})
+        self.assertEqual(MemberStreak.objects.get(person=self.people[2]).current_streak, 0)
+        self.assertEqual(MemberStreak.objects.get(person=self.people[3]).current_streak, 2)
+
+        self.assertEqual(self.submit("tok").status_code, status.HTTP_410_GONE)
+
+    def test_query_count_does_not_grow_with_assignments(self):
+        self.make_link("small")
+        with CaptureQueriesContext(connection) as small:
+            self.submit("small")
+        RosterFeedback.objects.all().delete()
+        MemberStreak.objects.all().delete()
+
+        roster = Rosters.objects.filter(date=self.day).first()
+        role = Roles.objects.get(name="Camera")
+        for i in range(20):
+            person = Persons.objects.create(first_name=f"X{i}", last_name="Share", email=f"x{i}@example.com")
+            Assignment.objects.create(roster=roster, role=role, person=person)
+        self.make_link("large")
+        with CaptureQueriesContext(connection) as large:
+            self.submit("large")
+        self.assertEqual(len(small), len(large))
+
+
+class TestFeedbackShareGet(APITestCase):
+    def setUp(self):
+        self.day = date(2026, 1, 4)
+        camera = Roles.objects.create(name="Camera")
+        audio = Roles.objects.create(name="Audio")
+        self.ann = Persons.objects.create(first_name="Ann", last_name="Zed", email="ann@example.com")
+        self.bob = Persons.objects.create(first_name="Bob", last_name="Young", email="bob@example.com")
+        self.morning = Rosters.objects.create(event=Events.objects.create(name="Morning"), date=self.day)
+        Rosters.objects.create(event=Events.objects.create(name="Evening"), date=self.day)
+        Assignment.objects.create(roster=self.morning, role=camera, person=self.ann)
+        Assignment.objects.create(roster=self.morning, role=audio, person=self.bob)
+        FeedbackShareLink.objects.create(token="tok", date=self.day)
+        self.url = reverse("feedback_share_get", args=["tok"])
+
+    def test_payload_shape(self):
+        body = self.client.get(self.url).json()
+        self.assertEqual([e["event_name"] for e in body["events"]], ["Morning", "Evening"])
+        self.assertEqual([a["role"] for a in body["events"][0]["assignments"]], ["Audio", "Camera"])
+        self.assertEqual(body["events"][1]["assignments"], [])
+        self.assertEqual([m["name"] for m in body["members"]], ["Ann Zed", "Bob Young"])
+
+    def test_etag_revalidation_and_invalidation(self):
+        first = self.client.get(self.url)
+        etag = first["ETag"]
+
+        # The link lookup and the data-version read.
+        with self.assertNumQueries(2):
+            repeat = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(repeat.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Assignment.objects.filter(person=self.bob).delete()
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed["ETag"], etag)
+        self.assertEqual(len(changed.json()["members"]), 1)
+
+
+class TestFeedbackSummary(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(User.objects.create_user(username="admin", password="pw"))
+        self.ann = Persons.objects.create(first_name="Ann", last_name="A", email="ann@example.com")
+        self.bob = Persons.objects.create(first_name="Bob", last_name="B", email="bob@example.com")
+        morning = Events.objects.create(name="Morning")
+        evening = Events.objects.create(name="Evening")
+        for week in range(3):
+            day = date(2026, 1, 4) + timedelta(weeks=week)
+            first = Rosters.objects.create(event=morning, date=day)
+            second = Rosters.objects.create(event=evening, date=day)
+            RosterFeedback.objects.create(roster=first, person=self.ann, is_present=False, feedback="late")
+            RosterFeedback.objects.create(roster=second, person=self.ann, is_present=True, feedback="ok")
+            RosterFeedback.objects.create(roster=first, person=self.bob, is_present=False)
+        FeedbackShareLink.objects.create(
+            token="tok", date=date(2026, 1, 18), is_used=True, global_feedback="Great service",
+        )
+        refresh_daily_feedback(Rosters.objects.values_list('date', flat=True))
+
+    def test_summary_groups_each_day(self):
+        body = self.client.get(reverse("feedback_summary")).json()
+        self.assertEqual([d["date"] for d in body], ["2026-01-18", "2026-01-11", "2026-01-04"])
+        day = body[1]
+        self.assertEqual((day["present"], day["absent"]), (["Ann A"], ["Bob B"]))
+        self.assertEqual((day["present_count"], day["absent_count"]), (1, 1))
+        self.assertEqual(day["feedback"], "late / ok")
+        self.assertEqual(body[0]["feedback"], "Great service")
+
+    def test_keyset_pages_and_bounds(self):
+        url = reverse("feedback_summary")
+        first = self.client.get(url, {"limit": 2}).json()
+        self.assertEqual([d["date"] for d in first["results"]], ["2026-01-18", "2026-01-11"])
+        second = self.client.get(url, {"limit": 2, "before": first["next_before"]}).json()
+        self.assertEqual([d["date"] for d in second["results"]], ["2026-01-04"])
+        self.assertIsNone(second["next_before"])
+
+        bounded = self.client.get(url, {"from": "2026-01-05", "to": "2026-01-11"}).json()
+        self.assertEqual([d["date"] for d in bounded], ["2026-01-11"])
+        self.assertEqual(self.client.get(url, {"from": "soon"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rollup_follows_feedback_writes(self):
+        roster = Rosters.objects.filter(date=date(2026, 1, 4)).first()
+        self.client.post(
+            reverse("submit_feedback", args=[roster.pk]),
+            {"feedback": [{"person_id": self.bob.pk, "is_present": True}]}, format='json',
+        )
+        summary = DailyFeedbackSummary.objects.get(date=date(2026, 1, 4))
+        self.assertEqual((summary.present_count, summary.absent_count), (2, 0))
+
+        self.client.patch(reverse("update_day_feedback", args=["2026-01-04"]), {"feedback": "Edited"}, format='json')
+        self.assertEqual(DailyFeedbackSummary.objects.get(date=date(2026, 1, 4)).feedback, "Edited")
+
+        Rosters.objects.filter(date=date(2026, 1, 4)).delete()
+        refresh_daily_feedback([date(2026, 1, 4)])
+        self.assertFalse(DailyFeedbackSummary.objects.filter(date=date(2026, 1, 4)).exists())
+
+        with self.assertNumQueries(2):
+            self.client.get(reverse("feedback_summary"))
+
+
+class TestCacheVersions(APITestCase):
+    def test_version_survives_a_cold_cache(self):
+        Persons.objects.create(first_name="Ann", last_name="A", email="ann@example.com")
+        version = get_version("scheduling:data")
+        self.assertGreater(version, 0)
+        # A fresh worker process starts with an empty cache but sees the same version.
+        cache.clear()
+        self.assertEqual(get_version("scheduling:data"), version)
+
+    def test_queryset_delete_bumps_once(self):
+        for i in range(5):
+            Persons.objects.create(first_name=f"P{i}", last_name="T", email=f"p{i}@example.com")
+        version = get_version("scheduling:data")
+        Persons.objects.all().delete()
+        self.assertEqual(get_version("scheduling:data"), version + 1)
+
+
+class TestAwardStats(APITestCase):
+    def setUp(self):
+        # Versions roll back with each test's transaction; cached entries do not.
+        cache.clear()
+        self.day_off = AwardType.objects.create(name="Day off")
+        self.gift = AwardType.objects.create(name="Gift")
+        self.ann = Persons.objects.create(first_name="Ann", last_name="A", email="ann@example.com")
+        self.bob = Persons.objects.create(first_name="Bob", last_name="B", email="bob@example.com")
+        today = date.today()
+        Award.objects.create(person=self.ann, award_type=self.day_off, given_at=today)
+        Award.objects.create(person=self.ann, award_type=self.gift, given_at=date(2025, 1, 10))
+        Award.objects.create(person=self.bob, award_type=self.day_off, given_at=date(2025, 1, 20))
+
+    def test_stats_are_aggregated_and_cached(self):
+        # Version lookup plus the grouped query.
+        with self.assertNumQueries(2):
+            body = self.client.get(reverse("award_stats")).json()
+        self.assertEqual(
+            (body["total"], body["this_month"], body["unique_recipients"], body["unique_types"]), (3, 1, 2, 2)
+        )
+        self.assertEqual([(t["name"], t["count"]) for t in body["by_type"]], [("Day off", 2), ("Gift", 1)])
+        self.assertEqual([(p["name"], p["count"]) for p in body["top_recipients"]], [("Ann A", 2), ("Bob B", 1)])
+        self.assertEqual(body["by_month"][0], {"month": "2025-01", "count": 2})
+
+        with self.assertNumQueries(1):
+            self.client.get(reverse("award_stats"))
+
+    def test_award_writes_invalidate_cache(self):
+        self.client.get(reverse("award_stats"))
+        award = Award.objects.get(person=self.bob)
+        self.client.delete(reverse("award_detail", args=[award.pk]))
+        self.assertEqual(self.client.get(reverse("award_stats")).json()["total"], 2)
+
+
+class TestCursorPagination(APITestCase):
+    def setUp(self):
+        award_type = AwardType.objects.create(name="Gift")
+        role = Roles.objects.create(name="Camera")
+        event = Events.objects.create(name="Service")
+        self.people = [
+            Persons.objects.create(first_name=f"C{i}", last_name="Cursor", email=f"c{i}@example.com")
+            for i in range(5)
+        ]
+        for i, person in enumerate(self.people):
+            # Two awards share each date so ties must be broken by id.
+            Award.objects.create(person=person, award_type=award_type, given_at=date(2026, 1, 1 + i // 2))
+            roster = Rosters.objects.create(event=event, date=date(2026, 3, 1) - timedelta(days=i))
+            Assignment.objects.create(roster=roster, role=role, person=person)
+
+    def walk(self, url_name):
+        ids = []
+        response = self.client.get(reverse(url_name), {"pagination": "cursor", "page_size": 2})
+        while True:
+            body = response.json()
+            self.assertNotIn("count", body)
+            ids.extend(row["id"] for row in body["results"])
+            if not body["next"]:
+                return ids
+            response = self.client.get(body["next"])
+
+    def test_awards_walk_by_given_at_then_id(self):
+        expected = list(Award.objects.order_by('-given_at', '-id').values_list('id', flat=True))
+        self.assertEqual(self.walk("awards"), expected)
+
+    def test_assignments_walk_by_roster_date_then_id(self):
+        expected = list(Assignment.objects.order_by('roster__date', 'id').values_list('id', flat=True))
+        self.assertEqual(self.walk("assignments"), expected)
+        self.assertEqual(self.walk("rosters"), list(Rosters.objects.order_by('date', 'id').values_list('id', flat=True)))
+
+    def test_keyset_holds_position_across_inserts(self):
+        expected = list(Award.objects.order_by('-given_at', '-id').values_list('id', flat=True))
+        first = self.client.get(reverse("awards"), {"pagination": "cursor", "page_size": 2}).json()
+        self.assertEqual([row["id"] for row in first["results"]], expected[:2])
+
+        # A tie with the last row seen (higher id, so already passed) and a row still ahead.
+        award_type = AwardType.objects.get()
+        last_seen = Award.objects.get(pk=expected[1])
+        Award.objects.create(person=self.people[0], award_type=award_type, given_at=last_seen.given_at)
+        ahead = Award.objects.create(person=self.people[0], award_type=award_type, given_at=date(2025, 12, 31))
+
+        ids = [row["id"] for row in first["results"]]
+        response = self.client.get(first["next"])
+        second = response.json()
+        while True:
+            body = response.json()
+            ids.extend(row["id"] for row in body["results"])
+            if not body["next"]:
+                break
+            response = self.client.get(body["next"])
+        self.assertEqual(ids, expected + [ahead.pk])
+
+        # Walking back shows the two rows now immediately before the second page.
+        current = list(Award.objects.order_by('-given_at', '-id').values_list('id', flat=True))
+        start = current.index(second["results"][0]["id"])
+        back = self.client.get(second["previous"]).json()
+        self.assertEqual([row["id"] for row in back["results"]], current[start - 2:start])
+
+    def test_rejects_garbled_cursor(self):
+        response = self.client.get(reverse("awards"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_rejects_cursor_values_of_the_wrong_type(self):
+        def cursor(values):
+            return base64.urlsafe_b64encode(json.dumps({"v": values, "r": False}).encode()).decode()
+
+        cases = {
+            "awards": [["bad", 1], ["2026-01-01", "x"], [[], 1]],
+            "persons": [["x"], [{"id": 1}]],
+            "assignments": [["2026-03-01", "x"], ["not-a-date", 1]],
+            "rosters": [["2026-13-45", 1], [None, "x"], [None, 1]],
+        }
+        for url_name, bad_values in cases.items():
+            for values in bad_values:
+                response = self.client.get(reverse(url_name), {"cursor": cursor(values)})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, (url_name, values))
+
+    def test_plain_requests_keep_existing_shapes(self):
+        self.assertIn("count", self.client.get(reverse("persons")).json())
+        self.assertIsInstance(self.client.get(reverse("assignments")).json(), list)
+
+
+class TestListQueryCounts(APITestCase):
+    URL_NAMES = ("persons", "active_members", "events", "rosters", "assignments", "awards")
+
+    def setUp(self):
+        self.roles = [Roles.objects.create(name=f"Role {i}") for i in range(3)]
+        self.award_type = AwardType.objects.create(name="Gift")
+        self.admin = User.objects.create_user(username="giver", password="pw", first_name="Giver")
+        self.counter = 0
+
+    def add_rows(self, n):
+        for _ in range(n):
+            i = self.counter = self.counter + 1
+            person = Persons.objects.create(first_name=f"L{i}", last_name="List", email=f"l{i}@example.com")
+            person.roles.set(self.roles[:2])
+            event = Events.objects.create(name=f"Event {i}")
+            event.roles.set(self.roles)
+            roster = Rosters.objects.create(event=event, date=date(2026, 1, 1) + timedelta(days=i))
+            Assignment.objects.create(roster=roster, role=self.roles[0], person=person)
+            Award.objects.create(person=person, award_type=self.award_type, given_at=roster.date, given_by=self.admin)
+            RosterFeedback.objects.create(roster=roster, person=person, is_present=True)
+
+    def query_counts(self):
+        counts = {}
+        for name in self.URL_NAMES:
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get(reverse(name)).status_code, status.HTTP_200_OK)
+            counts[name] = len(queries)
+        return counts
+
+    def test_list_endpoints_use_constant_queries(self):
+        self.add_rows(2)
+        few = self.query_counts()
+        self.add_rows(10)
+        self.assertEqual(self.query_counts(), few)
+
+
+class TestFastListRows(APITestCase):
+    def setUp(self):
+        camera = Roles.objects.create(name="Camera", description="Main camera")
+        sound = Roles.objects.create(name="Sound", is_special_role=True, max_assignments=2)
+        ann = Persons.objects.create(
+            first_name="Ann", last_name="Émile", email="ann@example.com", area_of_residence="Kampala",
+        )
+        ann.roles.set([sound, camera])
+        Persons.objects.create(first_name="Solo", last_name="", email="solo@example.com", phone_number=None)
+        event = Events.objects.create(name="Morning", start_time=time(9, 30), end_time=time(11, 0, 15))
+        event.roles.set([camera, sound])
+        Events.objects.create(name=None)
+        Rosters.objects.create(event=event, date=date(2026, 1, 4))
+        Rosters.objects.create(event=None, date=date(2026, 1, 5))
+
+    def assertSameBytes(self, rows, serializer_data):
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(rows), renderer.render(serializer_data))
+
+    def test_rows_render_identically_to_serializers(self):
+        self.assertSameBytes(
+            person_rows(Persons.objects.filter(is_active=True)),
+            PersonsSerializer(Persons.objects.filter(is_active=True).prefetch_related('roles'), many=True).data,
+        )
+        self.assertSameBytes(role_rows(Roles.objects.all()), RolesSerializer(Roles.objects.all(), many=True).data)
+        self.assertSameBytes(
+            event_rows(Events.objects.all()),
+            EventsSerializer(Events.objects.prefetch_related('roles'), many=True).data,
+        )
+        self.assertSameBytes(
+            roster_rows(Rosters.objects.all()),
+            RostersSerializer(Rosters.objects.select_related('event'), many=True).data,
+        )
+
+    def test_active_members_uses_two_queries(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("active_members"))
+        self.assertEqual(response.json()[0]["role_names"], ["Camera", "Sound"])
@@ -16,6 +16,7 @@ urlpatterns = [
     path('persons/modify/<int:id>/', modify_person, name='modify_person'),
     path('persons/<int:pk>/', person_detail, name='person_detail'),
     path('persons/bulk-upload/', bulk_upload_persons, name='bulk_upload_persons'),
+    path('persons/bulk-upload/csv/', bulk_upload_persons_csv, name='bulk_upload_persons_csv'),
     path('roles/', roles, name='roles'),
     path('roles/modify/<int:id>/', modify_role, name='modify_role'),
     path('roles/<int:pk>/', role_detail, name='role_detail'),
@@ -28,6 +29,11 @@ urlpatterns = [
     path('assignments/', assignments, name='assignments'),
     path('assignments/<int:pk>/', assignment_detail, name='assignment_detail'),
     path('availability/status-choices/', get_status, name='status-choices'),
+    path('metrics/', metrics, name='metrics'),
+    # Background jobs
+    path('jobs/<int:pk>/', job_detail, name='job_detail'),
+    path('jobs/<int:pk>/retry/', job_retry, name='job_retry'),
+    path('jobs/<int:pk>/output/', job_output, name='job_output'),
     path('generate-roster/', generate_and_download_roster, name='generate_roster'),
     # Awards
     path('award-types/', award_types, name='award_types'),
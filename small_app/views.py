@@ -1,33 +1,49 @@
-import ast
+import csv
+import hashlib
 import json
 import secrets
 from datetime import datetime, date
 
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
-from django.db.models import Q
-from django.http import HttpResponse
+from django.db.models import F, Q
+from django.http import FileResponse, HttpResponse
 from django.utils import timezone
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, parser_classes, permission_classes
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from scheduling.caching import bump_data_version, get_data_version
 from scheduling.generator import RosterGenerator
 from scheduling.services import generate_roster
 
 from .models import (
     User, Persons, Roles, Events, Rosters, Assignment, MembersBulkUpload,
     AwardType, Award, RosterFeedback, MemberStreak, FeedbackShareLink,
+    BackgroundJob, DailyFeedbackSummary,
 )
+from .award_stats import get_award_stats
+from .bulk_import import import_csv_upload, import_json_upload
+from .fast_lists import event_rows, person_rows, role_rows, roster_rows
+from .feedback_rollup import refresh_daily_feedback
+from .jobs import enqueue, find_job, job_payload, retry as retry_job
+from .metrics import registry as metrics_registry
+from .pagination import KeysetPagination
 from .pdf import export_roster_pdf
 from .serializers import (
     UserSerializer, PersonsSerializer, RolesSerializer, EventsSerializer,
     RostersSerializer, AssignmentSerializer, AwardTypeSerializer,
     AwardSerializer, RosterFeedbackSerializer,
 )
+from .streaks import recalculate_streaks, update_streaks
 
 
 class MyPagination(PageNumberPagination):
@@ -36,25 +52,16 @@ class MyPagination(PageNumberPagination):
     max_page_size = 70
 
 
-def parse_roles(roles):
+def _wants_cursor(request):
+    return request.query_params.get('pagination') == 'cursor' or 'cursor' in request.query_params
 
-    if not roles:
-        return []
 
-    try:
-        return ast.literal_eval(roles)
-    except (ValueError, SyntaxError):
-        pass
-
-    try:
-        return json.loads(roles)
-    except (ValueError, TypeError):
-        pass
-    
-    if isinstance(roles, str):
-            return [branch.strip() for branch in roles.split(',') if branch.strip()]
+def _cursor_page(request, queryset, serializer_class, ordering):
+    paginator = KeysetPagination()
+    paginator.ordering = ordering
+    page = paginator.paginate_queryset(queryset, request)
+    return paginator.get_paginated_response(serializer_class(page, many=True).data)
 
-    return [roles]
 
 # signing up users to the system
 @api_view(['POST'])
@@ -141,13 +148,15 @@ def persons(request):
         return Response(serializer.errors, status=400)
     elif request.method == 'GET':
         search_term = request.query_params.get('search', '').strip()
-        persons = Persons.objects.all()
+        persons = PersonsSerializer.setup_eager_loading(Persons.objects.order_by('id'))
         if search_term:
             persons = persons.filter(
                 Q(first_name__icontains=search_term) |
                 Q(last_name__icontains=search_term) |
                 Q(email__icontains=search_term)
             )
+        if _wants_cursor(request):
+            return _cursor_page(request, persons, PersonsSerializer, ('id',))
         paginator = MyPagination()
         paginated_persons = paginator.paginate_queryset(persons, request)
         serializer = PersonsSerializer(paginated_persons, many=True)
@@ -155,9 +164,7 @@ def persons(request):
 
 @api_view(['GET'])
 def active_members(request):
-    active_persons = Persons.objects.filter(is_active=True)
-    serializer = PersonsSerializer(active_persons, many=True)
-    return Response(serializer.data, status=200)
+    return Response(person_rows(Persons.objects.filter(is_active=True)), status=200)
     
 @api_view(['PUT', 'DELETE'])
 def modify_person(request, id):
@@ -173,7 +180,11 @@ def modify_person(request, id):
             return Response(serializer.data, status=200)
         return Response(serializer.errors, status=400)
     elif request.method == 'DELETE':
+        feedback_dates = list(
+            RosterFeedback.objects.filter(person=person).values_list('roster__date', flat=True).distinct()
+        )
         person.delete()
+        refresh_daily_feedback(feedback_dates)
         return Response({"message": "Person deleted successfully"}, status=204)
 @api_view(['GET'])
 def person_detail(request, pk):
@@ -186,63 +197,79 @@ def person_detail(request, pk):
 
 @api_view(['POST'])
 def bulk_upload_persons(request):
-    """Endpoint to handle bulk upload of persons via CSV file"""
+    """Endpoint to handle bulk upload of persons via CSV file
+
+    With ``"async": true`` the import is queued as a background job and the
+    response is 202 with the job's status URL payload.
+    """
     json_data = request.data.get('data')
     if not json_data:
         return Response({"error": "No data provided"}, status=400)
+    if not isinstance(json_data, list):
+        return Response({"error": "'data' must be a list of records"}, status=400)
+
+    idempotency_key = request.headers.get('Idempotency-Key')
+    existing = find_job(idempotency_key) if request.data.get('async') else None
+    if existing:
+        return Response(job_payload(existing), status=202)
+
     number_of_records = len(json_data)
     assortment_bulk_upload = MembersBulkUpload.objects.create(
         json_data=json_data, number_of_records= number_of_records)
-    for record in json_data:
-        first_name = record.get('first_name')
-        last_name = record.get('last_name')
-        email = record.get('email')
-        phone_number = record.get('contact')
-        area_of_residence = record.get('area_of_residence')
-        is_producer = record.get('is_producer', False)
-        is_assistant_producer = record.get('is_assistant_producer', False)
-        is_active = record.get('is_active', True)
-        roles = record.get('roles', [])
-
-        if not first_name:
-            print("Skipping record due to missing first name")
-            continue
-        if not last_name:
-            print("Skipping record due to missing last name")
-            continue
-        if not email:
-            record['email'] = f"{first_name.lower()}.{last_name.lower()}@gmail.com"
-        if not phone_number:
-            record['phone_number'] = "0700000000"
-        else:
-            record['phone_number'] = str(phone_number)
-        if not area_of_residence:
-            record['area_of_residence'] = ""
-        if not is_producer:
-            record['is_producer'] = False
-        if not is_assistant_producer:
-            record['is_assistant_producer'] = False
-        if not is_active:
-            record['is_active'] = True
-        role_ids = []
-        if roles:
-            roles = parse_roles(roles)
-            for rname in roles:
-                role_obj, _ = Roles.objects.get_or_create(name__iexact=rname, defaults={'name': rname})
-                role_ids.append(role_obj.id)
-
-        record.pop("roles", None)  # Remove roles to avoid issues in serializer
-        serializer = PersonsSerializer(data=record)
-        if serializer.is_valid():
-            person = serializer.save()
-            if role_ids:
-                person.roles.set(role_ids)
-            assortment_bulk_upload.success_products += 1
-    return Response({
-        "message": "Bulk upload completed",
-        "total_records": number_of_records,
-        "successful_uploads": assortment_bulk_upload.success_products
-    }, status=201)
+
+    if request.data.get('async'):
+        job = enqueue(
+            'bulk_upload_persons', {'upload_id': assortment_bulk_upload.pk},
+            idempotency_key=idempotency_key,
+            created_by=request.user if request.user.is_authenticated else None,
+            total_items=number_of_records,
+            checked=True,
+        )
+        return Response(job_payload(job), status=202)
+
+    result = import_json_upload(assortment_bulk_upload)
+    return Response({"message": "Bulk upload completed", **result}, status=201)
+
+
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+def bulk_upload_persons_csv(request):
+    """Multipart CSV upload of persons, streamed in chunks.
+
+    The file is stored on disk (not in ``json_data``) and read back row by row,
+    so memory use does not grow with the file size. Columns match the JSON
+    upload's fields. With ``async=true`` the import runs as a background job.
+    """
+    upload_file = request.FILES.get('file')
+    if not upload_file:
+        return Response({"error": "No file provided"}, status=400)
+    if not upload_file.name.lower().endswith('.csv'):
+        return Response({"error": "Only .csv files are supported"}, status=400)
+
+    run_async = str(request.data.get('async', '')).lower() in ('1', 'true', 'yes')
+    idempotency_key = request.headers.get('Idempotency-Key')
+    existing = find_job(idempotency_key) if run_async else None
+    if existing:
+        return Response(job_payload(existing), status=202)
+
+    upload = MembersBulkUpload(json_data=None)
+    upload.source_file.save(upload_file.name, upload_file, save=False)
+    upload.save()
+
+    if run_async:
+        job = enqueue(
+            'bulk_upload_persons', {'upload_id': upload.pk},
+            idempotency_key=idempotency_key,
+            created_by=request.user if request.user.is_authenticated else None,
+            checked=True,
+        )
+        return Response(job_payload(job), status=202)
+
+    try:
+        result = import_csv_upload(upload)
+    except (UnicodeDecodeError, csv.Error) as e:
+        return Response({"error": f"Could not read CSV file: {e}"}, status=400)
+    return Response({"message": "Bulk upload completed", **result}, status=201)
 
 
 @api_view(['POST','GET'])
@@ -254,9 +281,7 @@ def roles(request):
             return Response(serializer.data, status=201)
         return Response(serializer.errors, status=400)
     elif request.method == 'GET':
-        roles = Roles.objects.all()
-        serializer = RolesSerializer(roles, many=True)
-        return Response(serializer.data, status=200)
+        return Response(role_rows(Roles.objects.all()), status=200)
 @api_view(['PUT', 'DELETE'])
 def modify_role(request, id):
     try:
@@ -298,9 +323,7 @@ def events(request):
             return Response(serializer.data, status=201)
         return Response(serializer.errors, status=400)
     elif request.method == 'GET':
-        events = Events.objects.all()
-        serializer = EventsSerializer(events, many=True)
-        return Response(serializer.data, status=200)
+        return Response(event_rows(Events.objects.all()), status=200)
 @api_view(['PUT', 'DELETE'])
 def modify_event(request, id):
     try:
@@ -320,7 +343,9 @@ def modify_event(request, id):
             return Response(serializer.data, status=200)
         return Response(serializer.errors, status=400)
     elif request.method == 'DELETE':
+        roster_dates = list(Rosters.objects.filter(event=event).values_list('date', flat=True))
         event.delete()
+        refresh_daily_feedback(roster_dates)
         return Response({"message": "Event deleted successfully"}, status=204)
 @api_view(['GET'])
 def event_detail(request, pk):
@@ -349,6 +374,8 @@ def rosters(request):
             Persons.objects.filter(id__in=absent_members).update(is_present=False)
         if inactive_events:
             Events.objects.filter(id__in=inactive_events).update(is_active=False)
+        if absent_members or inactive_events:
+            bump_data_version()
 
 
         try:
@@ -365,9 +392,10 @@ def rosters(request):
         return Response(structured_roster, status=status.HTTP_201_CREATED)
 
     elif request.method == 'GET':
-        rosters = Rosters.objects.all()
-        serializer = RostersSerializer(rosters, many=True)
-        return Response(serializer.data)
+        if _wants_cursor(request):
+            rosters = RostersSerializer.setup_eager_loading(Rosters.objects.all())
+            return _cursor_page(request, rosters, RostersSerializer, ('date', 'id'))
+        return Response(roster_rows(Rosters.objects.all()))
 
     elif request.method == 'PUT':
         roster_id = request.data.get('id')
@@ -376,9 +404,11 @@ def rosters(request):
         except Rosters.DoesNotExist:
             return Response({"error": "Roster not found"}, status=404)
 
+        previous_date = roster.date
         serializer = RostersSerializer(roster, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            refresh_daily_feedback([previous_date, roster.date])
             return Response(serializer.data)
         return Response(serializer.errors, status=400)
 
@@ -387,12 +417,22 @@ def rosters(request):
         try:
             roster = Rosters.objects.get(id=roster_id)
             roster.delete()
+            refresh_daily_feedback([roster.date])
             return Response({"message": "Roster deleted successfully"}, status=204)
         except Rosters.DoesNotExist:
             return Response({"error": "Roster not found"}, status=404)
 
     return Response({"error": "Method not allowed"}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def metrics(request):
+    """Per-view latency and SQL metrics in Prometheus text format."""
+    return HttpResponse(
+        metrics_registry.render_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
+
 @api_view(['GET'])
 def get_status(request):
     # returns the status choices for boolean field
@@ -412,7 +452,12 @@ def assignments(request):
             return Response(serializer.data, status=201)
         return Response(serializer.errors, status=400)
     elif request.method == 'GET':
-        assignments = Assignment.objects.all()
+        assignments = AssignmentSerializer.setup_eager_loading(Assignment.objects.all())
+        if _wants_cursor(request):
+            return _cursor_page(
+                request, assignments.annotate(roster_date=F('roster__date')),
+                AssignmentSerializer, ('roster_date', 'id'),
+            )
         serializer = AssignmentSerializer(assignments, many=True)
         return Response(serializer.data, status=200)
     elif request.method == 'PUT':
@@ -441,7 +486,7 @@ def assignments(request):
 @api_view(['GET'])
 def assignment_detail(request, pk):
     try:
-        assignment = Assignment.objects.get(pk=pk)
+        assignment = AssignmentSerializer.setup_eager_loading(Assignment.objects).get(pk=pk)
     except Assignment.DoesNotExist:
         return Response({"error": "Assignment not found"}, status=404)
 
@@ -498,6 +543,47 @@ def generate_and_download_roster(request):
     return response
 
 
+# ──────────────────────────────────────────
+# Background jobs
+# ──────────────────────────────────────────
+@api_view(['GET'])
+def job_detail(request, pk):
+    """Status and progress of a background job."""
+    try:
+        job = BackgroundJob.objects.get(pk=pk)
+    except BackgroundJob.DoesNotExist:
+        return Response({"error": "Job not found"}, status=404)
+    return Response(job_payload(job), status=200)
+
+
+@api_view(['POST'])
+def job_retry(request, pk):
+    """Re-queue a failed or stalled job. Handlers are idempotent, so this is always safe."""
+    try:
+        job = BackgroundJob.objects.get(pk=pk)
+    except BackgroundJob.DoesNotExist:
+        return Response({"error": "Job not found"}, status=404)
+    if not retry_job(job):
+        return Response(
+            {"error": f"Only failed or stalled jobs can be retried (status: {job.status})."}, status=409
+        )
+    job.refresh_from_db()
+    return Response(job_payload(job), status=202)
+
+
+@api_view(['GET'])
+def job_output(request, pk):
+    """Download the file a job produced (e.g. an exported roster PDF)."""
+    try:
+        job = BackgroundJob.objects.get(pk=pk)
+    except BackgroundJob.DoesNotExist:
+        return Response({"error": "Job not found"}, status=404)
+    if job.status != BackgroundJob.SUCCEEDED or not job.output:
+        return Response({"error": "Job has no output yet."}, status=404)
+    filename = (job.result or {}).get('filename') or job.output.name.rsplit('/', 1)[-1]
+    return FileResponse(job.output.open('rb'), as_attachment=True, filename=filename)
+
+
 # ──────────────────────────────────────────
 # Award-type CRUD
 # ──────────────────────────────────────────
@@ -551,7 +637,7 @@ def _parse_date(value):
 @api_view(['GET', 'POST'])
 def awards(request):
     if request.method == 'GET':
-        qs = Award.objects.select_related('person', 'award_type', 'given_by').all()
+        qs = AwardSerializer.setup_eager_loading(Award.objects.all())
 
         person_id = request.query_params.get('person')
         type_id = request.query_params.get('type')
@@ -569,6 +655,8 @@ def awards(request):
         if to_date:
             qs = qs.filter(given_at__lte=to_date)
 
+        if _wants_cursor(request):
+            return _cursor_page(request, qs, AwardSerializer, ('-given_at', '-id'))
         paginator = MyPagination()
         page = paginator.paginate_queryset(qs, request)
         serializer = AwardSerializer(page, many=True)
@@ -590,11 +678,8 @@ def awards(request):
         serializer.validated_data['given_at'] = date.today()
 
     award = serializer.save(streak_at_award=streak_snapshot, given_by=given_by)
-
-    if streak.current_streak > streak.longest_streak:
-        streak.longest_streak = streak.current_streak
-    streak.current_streak = 0
-    streak.save()
+    # The award resets the streak: rescanning counts only feedback after it.
+    recalculate_streaks([person.pk])
 
     return Response(AwardSerializer(award).data, status=201)
 
@@ -610,70 +695,24 @@ def award_detail(request, pk):
         serializer = AwardSerializer(award)
         return Response(serializer.data, status=200)
     elif request.method == 'PUT':
+        previous_person_id = award.person_id
         serializer = AwardSerializer(award, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            award = serializer.save()
+            # Moving or re-dating an award moves the streak reset with it.
+            recalculate_streaks({previous_person_id, award.person_id})
             return Response(serializer.data, status=200)
         return Response(serializer.errors, status=400)
     elif request.method == 'DELETE':
         award.delete()
+        recalculate_streaks([award.person_id])
         return Response({"message": "Award deleted"}, status=204)
 
 
 @api_view(['GET'])
 def award_stats(request):
-    """Aggregate counts for the awards dashboard."""
-    from django.db.models import Count
-    from django.db.models.functions import TruncMonth
-
-    today = date.today()
-    month_start = today.replace(day=1)
-    qs = Award.objects.all()
-
-    by_type = list(
-        qs.values('award_type', 'award_type__name')
-          .annotate(count=Count('id'))
-          .order_by('-count')
-    )
-    by_type = [
-        {'award_type_id': row['award_type'], 'name': row['award_type__name'], 'count': row['count']}
-        for row in by_type
-    ]
-
-    top_recipients = list(
-        qs.values('person', 'person__first_name', 'person__last_name')
-          .annotate(count=Count('id'))
-          .order_by('-count')[:10]
-    )
-    top_recipients = [
-        {
-            'person_id': row['person'],
-            'name': f"{row['person__first_name']} {row['person__last_name']}".strip(),
-            'count': row['count'],
-        }
-        for row in top_recipients
-    ]
-
-    by_month = list(
-        qs.annotate(month=TruncMonth('given_at'))
-          .values('month')
-          .annotate(count=Count('id'))
-          .order_by('month')
-    )
-    by_month = [
-        {'month': row['month'].strftime('%Y-%m'), 'count': row['count']}
-        for row in by_month if row['month']
-    ]
-
-    return Response({
-        'total': qs.count(),
-        'this_month': qs.filter(given_at__gte=month_start).count(),
-        'unique_recipients': qs.values('person').distinct().count(),
-        'unique_types': qs.values('award_type').distinct().count(),
-        'by_type': by_type,
-        'top_recipients': top_recipients,
-        'by_month': by_month,
-    }, status=200)
+    """Aggregate counts for the awards dashboard, served from cache when fresh."""
+    return Response(get_award_stats(), status=200)
 
 
 @api_view(['GET'])
@@ -681,45 +720,13 @@ def person_awards(request, pk):
     """Return all awards received by a single person."""
     if not Persons.objects.filter(pk=pk).exists():
         return Response({"error": "Person not found"}, status=404)
-    qs = (
-        Award.objects
-        .filter(person_id=pk)
-        .select_related('award_type', 'given_by')
-    )
+    qs = AwardSerializer.setup_eager_loading(Award.objects.filter(person_id=pk))
     return Response(AwardSerializer(qs, many=True).data, status=200)
 
 
 # ──────────────────────────────────────────
 # Roster Feedback
 # ──────────────────────────────────────────
-def _recalculate_streak(person_id):
-    """Recompute and persist the attendance streak for a single person."""
-    try:
-        person = Persons.objects.get(pk=person_id)
-    except Persons.DoesNotExist:
-        return
-
-    feedbacks = (
-        RosterFeedback.objects
-        .filter(person=person)
-        .select_related('roster')
-        .order_by('-roster__date')
-    )
-
-    current_streak = 0
-    for fb in feedbacks:
-        if fb.is_present:
-            current_streak += 1
-        else:
-            break
-
-    streak, _ = MemberStreak.objects.get_or_create(person=person)
-    if current_streak > streak.longest_streak:
-        streak.longest_streak = current_streak
-    streak.current_streak = current_streak
-    streak.save()
-
-
 @api_view(['GET'])
 def person_streaks(request):
     """Return current and longest attendance streak for every active member."""
@@ -774,6 +781,9 @@ def roster_persons(request, roster_id):
 
 
 
+FEEDBACK_FIELDS = ('is_present', 'feedback', 'rating', 'feedback_category')
+
+
 @api_view(['POST'])
 def submit_feedback(request, roster_id):
     """Bulk create/update feedback for a roster.
@@ -788,31 +798,44 @@ def submit_feedback(request, roster_id):
     if not items:
         return Response({"error": "No feedback data provided"}, status=400)
 
+    defaults_by_person = {}
     created = 0
     updated = 0
-    person_ids = []
     for item in items:
         person_id = item.get('person_id')
         if not person_id:
             continue
-        obj, was_created = RosterFeedback.objects.update_or_create(
-            roster=roster,
-            person_id=person_id,
-            defaults={
-                'is_present': item.get('is_present', False),
-                'feedback': item.get('feedback', ''),
-                'rating': item.get('rating') or None,
-                'feedback_category': item.get('feedback_category') or None,
-            }
-        )
-        person_ids.append(person_id)
-        if was_created:
-            created += 1
-        else:
+        try:
+            person_id = int(person_id)
+        except (TypeError, ValueError):
+            return Response({"error": f"Invalid person_id: {person_id}"}, status=400)
+        if person_id in defaults_by_person:
+            # A repeated person overwrites their earlier entry, as a second update would.
             updated += 1
+        defaults_by_person[person_id] = {
+            'is_present': item.get('is_present', False),
+            'feedback': item.get('feedback', ''),
+            'rating': item.get('rating') or None,
+            'feedback_category': item.get('feedback_category') or None,
+        }
+
+    # One read to split the counts, one upsert for every row.
+    existing_ids = set(
+        RosterFeedback.objects.filter(roster=roster, person_id__in=defaults_by_person)
+        .values_list('person_id', flat=True)
+    )
+    RosterFeedback.objects.bulk_create(
+        [RosterFeedback(roster=roster, person_id=pid, **d) for pid, d in defaults_by_person.items()],
+        update_conflicts=True,
+        unique_fields=['roster', 'person'],
+        update_fields=[*FEEDBACK_FIELDS, 'updated_at'],
+    )
+    created += len(defaults_by_person) - len(existing_ids)
+    updated += len(existing_ids)
 
-    for pid in person_ids:
-        _recalculate_streak(pid)
+    saved = [(pid, roster.date, d['is_present']) for pid, d in defaults_by_person.items()]
+    update_streaks(saved)
+    refresh_daily_feedback([roster.date])
 
     return Response({
         "message": "Feedback saved successfully",
@@ -824,9 +847,9 @@ def submit_feedback(request, roster_id):
 @api_view(['GET'])
 def roster_feedback(request, roster_id):
     """Return all feedback entries for a roster."""
-    qs = RosterFeedback.objects.filter(
-        roster_id=roster_id
-    ).select_related('person', 'roster__event')
+    qs = RosterFeedbackSerializer.setup_eager_loading(
+        RosterFeedback.objects.filter(roster_id=roster_id)
+    )
     serializer = RosterFeedbackSerializer(qs, many=True)
     return Response(serializer.data, status=200)
 
@@ -835,50 +858,78 @@ def roster_feedback(request, roster_id):
 # Shareable feedback link (public, one-time use)
 # ──────────────────────────────────────────
 def _build_share_payload(link):
-    """Aggregate every roster + assignment for the link's date into a single payload."""
-    rosters_qs = (
+    """Aggregate every roster + assignment for the link's date into a single payload.
+
+    One query: rosters left-joined to their assignments, people and roles, so
+    rosters without assignments still appear with an empty list.
+    """
+    rows = (
         Rosters.objects
         .filter(date=link.date)
-        .select_related('event')
-        .prefetch_related('assignments__person', 'assignments__role')
-        .order_by('event__id')
+        .order_by('event__id', 'pk', 'assignments__role__name', 'assignments__pk')
+        .values_list(
+            'pk', 'event_id', 'event__name',
+            'assignments__person_id', 'assignments__person__first_name',
+            'assignments__person__last_name', 'assignments__role__name',
+        )
     )
 
-    events_payload = []
+    events_by_roster = {}
     seen_person_ids = set()
     members_payload = []
 
-    for roster in rosters_qs:
-        assignments = []
-        for a in roster.assignments.all().order_by('role__name'):
-            assignments.append({
-                'person_id': a.person.pk,
-                'name': f"{a.person.first_name} {a.person.last_name}".strip(),
-                'role': a.role.name,
-            })
-            if a.person.pk not in seen_person_ids:
-                seen_person_ids.add(a.person.pk)
-                members_payload.append({
-                    'person_id': a.person.pk,
-                    'name': f"{a.person.first_name} {a.person.last_name}".strip(),
-                })
-        events_payload.append({
-            'roster_id': roster.pk,
-            'event_id': roster.event.pk if roster.event else None,
-            'event_name': roster.event.name if roster.event else 'Unnamed event',
-            'assignments': assignments,
+    for roster_id, event_id, event_name, person_id, first_name, last_name, role_name in rows:
+        event = events_by_roster.get(roster_id)
+        if event is None:
+            event = events_by_roster[roster_id] = {
+                'roster_id': roster_id,
+                'event_id': event_id,
+                'event_name': event_name if event_id else 'Unnamed event',
+                'assignments': [],
+            }
+        if person_id is None:
+            continue
+        name = f"{first_name} {last_name}".strip()
+        event['assignments'].append({
+            'person_id': person_id,
+            'name': name,
+            'role': role_name,
         })
+        if person_id not in seen_person_ids:
+            seen_person_ids.add(person_id)
+            members_payload.append({
+                'person_id': person_id,
+                'name': name,
+            })
 
     members_payload.sort(key=lambda m: m['name'])
 
     return {
         'date': str(link.date),
         'is_used': link.is_used,
-        'events': events_payload,
+        'events': list(events_by_roster.values()),
         'members': members_payload,
     }
 
 
+def _cached_share_payload(link):
+    """Return ``(payload, etag)`` for an open link, cached per (token, data version).
+
+    Any roster, assignment or person write moves the data version, so a
+    cached payload never outlives the assignments it was built from.
+    """
+    key = f"feedback-share:{link.token}:{get_data_version()}"
+    cached = cache.get(key)
+    if cached is None:
+        payload = _build_share_payload(link)
+        digest = hashlib.sha1(
+            json.dumps(payload, sort_keys=True, cls=DjangoJSONEncoder).encode()
+        ).hexdigest()
+        cached = (payload, quote_etag(digest))
+        cache.set(key, cached, timeout=settings.ROSTER_CACHE_TIMEOUT)
+    return cached
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def create_feedback_share_link(request):
@@ -918,7 +969,6 @@ def create_feedback_share_link(request):
 
     # Build an absolute, reachable URL when FRONTEND_BASE_URL is configured.
     # Otherwise return None and let the frontend fall back to its own origin.
-    from django.conf import settings
     share_url = (
         f"{settings.FRONTEND_BASE_URL}/feedback/share/{link.token}"
         if settings.FRONTEND_BASE_URL else None
@@ -941,7 +991,16 @@ def feedback_share_get(request, token):
         return Response({'error': 'Link not found'}, status=404)
     if link.is_used:
         return Response({'error': 'This link has already been used.'}, status=410)
-    return Response(_build_share_payload(link), status=200)
+
+    payload, etag = _cached_share_payload(link)
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        response = Response(status=304)
+    else:
+        response = Response(payload, status=200)
+    response['ETag'] = etag
+    # Let browsers keep the payload but revalidate on every open.
+    response['Cache-Control'] = 'no-cache'
+    return response
 
 
 @api_view(['POST'])
@@ -976,11 +1035,15 @@ def feedback_share_submit(request, token):
             continue
         presence_by_person[int(pid)] = bool(item.get('is_present', True))
 
-    rosters_for_day = list(Rosters.objects.filter(date=link.date))
-    if not rosters_for_day:
+    if not Rosters.objects.filter(date=link.date).exists():
         return Response({'error': 'No rosters exist for that date anymore.'}, status=400)
 
-    affected_person_ids = set()
+    # Every (roster, person) pair assigned on the link's date, in one query.
+    pairs = list(
+        Assignment.objects.filter(roster__date=link.date)
+        .values_list('roster_id', 'person_id').distinct()
+    )
+    affected_person_ids = {person_id for _, person_id in pairs}
     with transaction.atomic():
         # Atomically claim the link: only one request can flip is_used False->True.
         # If a concurrent submit already claimed it, claimed == 0 and we bail out,
@@ -996,25 +1059,26 @@ def feedback_share_submit(request, token):
         if not claimed:
             return Response({'error': 'This link has already been used.'}, status=410)
 
-        for roster in rosters_for_day:
-            assigned_person_ids = set(
-                Assignment.objects.filter(roster=roster).values_list('person_id', flat=True)
-            )
-            for person_id in assigned_person_ids:
-                is_present = presence_by_person.get(person_id, True)
-                RosterFeedback.objects.update_or_create(
-                    roster=roster,
+        RosterFeedback.objects.bulk_create(
+            [
+                RosterFeedback(
+                    roster_id=roster_id,
                     person_id=person_id,
-                    defaults={
-                        'is_present': is_present,
-                        'feedback': global_feedback,
-                        'recommendations': global_recommendations,
-                    },
+                    is_present=presence_by_person.get(person_id, True),
+                    feedback=global_feedback,
+                    recommendations=global_recommendations,
                 )
-                affected_person_ids.add(person_id)
-
-    for pid in affected_person_ids:
-        _recalculate_streak(pid)
+                for roster_id, person_id in pairs
+            ],
+            update_conflicts=True,
+            unique_fields=['roster', 'person'],
+            update_fields=['is_present', 'feedback', 'recommendations', 'updated_at'],
+        )
+        update_streaks(
+            (person_id, link.date, presence_by_person.get(person_id, True))
+            for _, person_id in pairs
+        )
+        refresh_daily_feedback([link.date])
 
     return Response({
         'message': 'Feedback submitted. Thank you.',
@@ -1023,74 +1087,79 @@ def feedback_share_submit(request, token):
     }, status=200)
 
 
+def _parse_date_param(request, name):
+    """Return ``(date or None, error Response or None)`` for an optional YYYY-MM-DD query param."""
+    value = request.query_params.get(name)
+    if not value:
+        return None, None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date(), None
+    except ValueError:
+        return None, Response({'error': f"Invalid '{name}' date. Use YYYY-MM-DD."}, status=400)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def feedback_summary(request):
     """Per-date summary of collected feedback: who was present and the day's note.
 
     Used by the admin feedback page to list already-collected days and to know
-    which dates should no longer offer link generation.
+    which dates should no longer offer link generation. Reads the
+    DailyFeedbackSummary rollup, so the cost follows the number of dates.
+
+    Query params (all optional): ``from`` / ``to`` bound the dates inclusively.
+    With ``limit`` the response is one keyset page, newest first:
+    ``{"results": [...], "next_before": "YYYY-MM-DD" | null}``; pass
+    ``next_before`` back as ``before`` for the following page. Without
+    ``limit`` every matching day is returned as a plain list.
     """
-    feedbacks = (
-        RosterFeedback.objects
-        .select_related('person', 'roster')
-        .order_by('-roster__date')
-    )
-
-    # Day-level note preferred from the share link used for that date.
-    used_links = FeedbackShareLink.objects.filter(is_used=True)
-    link_notes = {
-        str(link.date): link.global_feedback
-        for link in used_links
-        if link.global_feedback
-    }
-    link_recommendations = {
-        str(link.date): link.global_recommendations
-        for link in used_links
-        if link.global_recommendations
+    bounds = {}
+    for param, lookup in (('from', 'date__gte'), ('to', 'date__lte'), ('before', 'date__lt')):
+        value, error = _parse_date_param(request, param)
+        if error:
+            return error
+        if value:
+            bounds[lookup] = value
+
+    limit = request.query_params.get('limit')
+    if limit is not None:
+        try:
+            limit = int(limit)
+            if limit < 1:
+                raise ValueError
+        except ValueError:
+            return Response({'error': "'limit' must be a positive integer."}, status=400)
+
+    days = DailyFeedbackSummary.objects.filter(**bounds).order_by('-date')
+    days = list(days[:limit + 1] if limit else days)
+    next_before = None
+    if limit and len(days) > limit:
+        days = days[:limit]
+        next_before = str(days[-1].date)
+
+    names = {
+        pk: f"{first_name} {last_name}".strip()
+        for pk, first_name, last_name in Persons.objects.filter(
+            pk__in={pid for day in days for pid in day.present_ids + day.absent_ids}
+        ).values_list('pk', 'first_name', 'last_name')
     }
 
-    by_date = {}
-    for fb in feedbacks:
-        key = str(fb.roster.date)
-        entry = by_date.get(key)
-        if entry is None:
-            entry = {
-                'date': key,
-                'present': {},
-                'absent': {},
-                'notes': set(),
-                'recommendations': set(),
-                'submitted_at': fb.updated_at,
-            }
-            by_date[key] = entry
-        name = f"{fb.person.first_name} {fb.person.last_name}".strip()
-        if fb.is_present:
-            entry['present'][fb.person_id] = name
-            entry['absent'].pop(fb.person_id, None)
-        elif fb.person_id not in entry['present']:
-            entry['absent'][fb.person_id] = name
-        if fb.feedback:
-            entry['notes'].add(fb.feedback)
-        if fb.recommendations:
-            entry['recommendations'].add(fb.recommendations)
-        if fb.updated_at > entry['submitted_at']:
-            entry['submitted_at'] = fb.updated_at
+    result = [
+        {
+            'date': str(day.date),
+            'present': sorted(names[pid] for pid in day.present_ids if pid in names),
+            'absent': sorted(names[pid] for pid in day.absent_ids if pid in names),
+            'present_count': day.present_count,
+            'absent_count': day.absent_count,
+            'feedback': day.feedback,
+            'recommendations': day.recommendations,
+            'submitted_at': day.submitted_at.isoformat(),
+        }
+        for day in days
+    ]
 
-    result = []
-    for key, entry in by_date.items():
-        day_note = link_notes.get(key) or ' / '.join(sorted(entry['notes']))
-        result.append({
-            'date': entry['date'],
-            'present': sorted(entry['present'].values()),
-            'absent': sorted(entry['absent'].values()),
-            'present_count': len(entry['present']),
-            'absent_count': len(entry['absent']),
-            'feedback': day_note,
-            'recommendations': link_recommendations.get(key) or ' / '.join(sorted(entry['recommendations'])),
-            'submitted_at': entry['submitted_at'].isoformat(),
-        })
-    result.sort(key=lambda x: x['date'], reverse=True)
+    if limit:
+        return Response({'results': result, 'next_before': next_before}, status=200)
     return Response(result, status=200)
 
 
@@ -1124,6 +1193,7 @@ def update_day_feedback(request, date_str):
         global_feedback=feedback,
         global_recommendations=recommendations,
     )
+    refresh_daily_feedback([target_date])
 
     return Response({
         'date': date_str,
@@ -58,6 +58,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [    
+    'small_app.metrics.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -69,6 +70,11 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Per-request wall time / SQL count / SQL time, exposed as Server-Timing headers
+# and at /api/metrics/. Samples are kept in memory per process.
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', 'False').lower() == 'true'
+REQUEST_METRICS_WINDOW = int(os.environ.get('REQUEST_METRICS_WINDOW', 500))
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -112,6 +118,31 @@ DATABASES = {
     )
 }
 
+# Generated rosters are cached per (date, seed, engine, data version). The data
+# version lives in the database (CacheVersion), so invalidation reaches every
+# process on any backend. The local-memory backend still keeps one copy of each
+# entry per process; point CACHE_LOCATION at a directory to share entries
+# between gunicorn workers via the file backend.
+CACHE_LOCATION = os.environ.get('CACHE_LOCATION', '')
+CACHES = {
+    'default': {
+        'BACKEND': (
+            'django.core.cache.backends.filebased.FileBasedCache'
+            if CACHE_LOCATION else
+            'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': CACHE_LOCATION or 'small-backend',
+    }
+}
+ROSTER_CACHE_TIMEOUT = int(os.environ.get('ROSTER_CACHE_TIMEOUT', 60 * 60))
+AWARD_STATS_CACHE_TIMEOUT = int(os.environ.get('AWARD_STATS_CACHE_TIMEOUT', 60 * 60))
+
+# Background jobs: a RUNNING job untouched for JOB_STALE_AFTER seconds is assumed
+# to belong to a dead worker and is reclaimed; failed attempts wait
+# JOB_RETRY_BACKOFF seconds, doubling per attempt, before they run again.
+JOB_STALE_AFTER = int(os.environ.get('JOB_STALE_AFTER', 30 * 60))
+JOB_RETRY_BACKOFF = int(os.environ.get('JOB_RETRY_BACKOFF', 30))
+
 CORS_ALLOWED_ORIGINS = os.environ.get(
     'CORS_ALLOWED_ORIGINS',
     'http://localhost:3000,http://127.0.0.1:3000'
@@ -174,7 +205,14 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# Uploaded files and background-job output (e.g. exported PDFs).
+MEDIA_URL = 'media/'
+MEDIA_ROOT = Path(os.environ.get('MEDIA_ROOT', BASE_DIR / 'media'))
+
 STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
     'staticfiles': {
         'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
     },